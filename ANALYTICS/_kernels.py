@@ -0,0 +1,72 @@
+"""
+Analytics Numeric Kernels
+=========================
+Numba-compiled reductions used by the analytics dashboard.
+
+Numba is optional: when it is not installed HAVE_NUMBA is False and
+_category_correlation falls back to its np.bincount reductions.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True)
+    def groupwise_pearson(group_ids, x, y, n_groups):
+        """
+        Pearson correlation of x and y within each group.
+
+        Two linear passes over the arrays: the first accumulates per-group
+        sums for the means, the second accumulates centered cross products
+        (numerically stable, unlike the raw sum-of-squares formula).
+
+        Args:
+            group_ids: int32 array of group codes in [0, n_groups)
+            x: float64 array
+            y: float64 array
+            n_groups: Number of groups
+
+        Returns:
+            float64 array of per-group correlations; NaN for groups with
+            fewer than 3 rows or zero variance (matching pandas)
+        """
+        n = np.zeros(n_groups)
+        sx = np.zeros(n_groups)
+        sy = np.zeros(n_groups)
+        for i in range(group_ids.shape[0]):
+            g = group_ids[i]
+            n[g] += 1.0
+            sx[g] += x[i]
+            sy[g] += y[i]
+
+        mx = sx / np.maximum(n, 1.0)
+        my = sy / np.maximum(n, 1.0)
+
+        sxy = np.zeros(n_groups)
+        sxx = np.zeros(n_groups)
+        syy = np.zeros(n_groups)
+        for i in range(group_ids.shape[0]):
+            g = group_ids[i]
+            dx = x[i] - mx[g]
+            dy = y[i] - my[g]
+            sxy[g] += dx * dy
+            sxx[g] += dx * dx
+            syy[g] += dy * dy
+
+        r = np.full(n_groups, np.nan)
+        for g in range(n_groups):
+            if n[g] > 2 and sxx[g] > 0.0 and syy[g] > 0.0:
+                r[g] = sxy[g] / np.sqrt(sxx[g] * syy[g])
+        return r
+
+    # Compile at import so the JIT cost is not paid inside the analysis
+    groupwise_pearson(
+        np.zeros(2, dtype=np.int32), np.zeros(2), np.zeros(2), 1
+    )
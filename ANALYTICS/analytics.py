@@ -22,10 +22,18 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
+import bisect
+import io
+import math
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 import logging
 from typing import Dict, Tuple, Optional
 import json
+import shutil
+import sys
+
+import _kernels
 
 warnings.filterwarnings('ignore')
 
@@ -40,6 +48,157 @@ logger = logging.getLogger(__name__)
 plt.style.use('seaborn-v0_8-darkgrid')
 sns.set_palette("husl")
 
+# Static report scaffolding
+_RULE = "=" * 100
+_REPORT_HEADER = f"{_RULE}\n{' ' * 30}E-COMMERCE ETL ANALYTICS REPORT\n{' ' * 35}Generated: {{}}\n{_RULE}\n\n"
+_REPORT_FOOTER = f"{_RULE}\nEND OF REPORT\n{_RULE}"
+_SECTION_HEADER = f"{_RULE}\n{{}}\n{_RULE}\n\n"
+_SEP_40 = "   " + "-" * 40 + "\n"
+_SEP_60 = "   " + "-" * 60 + "\n"
+_SEP_65 = "   " + "-" * 65 + "\n"
+_SEP_82 = "   " + "-" * 82 + "\n"
+_SEP_90 = "   " + "-" * 90 + "\n"
+
+# Per-row report templates, rendered with str.format_map
+_CATEGORY_ROW = "   {category_name:<35} {product_count:>15,} {percentage:>14.2f}%\n"
+_PRICE_ROW = (
+    "   {category_name:<20} {product_count:>8,} ${avg_price:>9.2f} ${median_price:>9.2f} "
+    "${min_price:>9.2f} ${max_price:>9.2f} {avg_rating:>12}\n"
+)
+_SEGMENT_ROW = "   {segment:<15} {avg_rating:>12.2f} {count:>15,} ${avg_price:>11.2f}\n"
+_COMPANY_ROW = (
+    "   {company_name:<25} {product_count:>10,} {avg_rating:>12} "
+    "{total_reviews:>15,} {avg_reviews_per_product:>20,}\n"
+)
+
+# Independent SQL analyses run concurrently by run_complete_analysis, each on
+# its own connection (MySQL connections are not thread-safe)
+ANALYSIS_STEPS = (
+    'basic_profiling',
+    'category_distribution',
+    'price_rating_insights',
+    'price_rating_correlation',
+    'company_insights',
+)
+
+# Rows pulled per fetchmany() call when streaming raw product rows
+FETCH_BATCH_SIZE = 1000
+
+# Correlation bands for the report: bisect_left over the thresholds reproduces the
+# strict "> threshold" comparisons, so a value exactly on a boundary falls in the lower band
+_CORR_THRESHOLDS = (-0.3, -0.1, 0.1, 0.3)
+_CORR_LABELS = (
+    "Strong negative correlation",
+    "Moderate negative correlation",
+    "Weak/no correlation",
+    "Moderate positive correlation",
+    "Strong positive correlation",
+)
+
+# Key-findings templates, rendered with str.format_map against the values
+# collected while writing sections 1-5
+_VALUE_FINDING = (
+    "   • Value Perception: Negative correlation ({corr:.3f}) indicates customers find "
+    "better value in\n     lower-priced products. Consider value-based pricing strategies."
+)
+_INDEPENDENCE_FINDING = (
+    "   • Price Independence: Weak correlation ({corr:.3f}) shows price and quality are "
+    "largely independent.\n     Focus on product differentiation beyond price."
+)
+_PREMIUM_FINDING = (
+    "   • Price-Quality Signal: Positive correlation ({corr:.3f}) suggests customers "
+    "perceive higher-priced\n     products as better quality. Premium pricing strategy may be justified."
+)
+# Finding 1 narrative for each correlation band, parallel to _CORR_LABELS
+_CORR_FINDINGS = (_VALUE_FINDING, _VALUE_FINDING, _INDEPENDENCE_FINDING, _PREMIUM_FINDING, _PREMIUM_FINDING)
+
+# Indexed by "correlation is positive"
+_SIGN_MSGS = (
+    "   ✗ Higher-priced products tend to have LOWER ratings\n",
+    "   ✓ Higher-priced products tend to have HIGHER ratings\n",
+)
+
+_CATEGORY_FINDING = (
+    "   • Category Concentration: {top_cat} dominates with "
+    "{top_cat_pct:.1f}% of products.\n     Consider diversification or capitalize on this strength."
+)
+
+# Indexed by "top 10 companies hold more than 50% of products"
+_MARKET_FINDINGS = (
+    "   • Market Concentration: Top 10 companies account for {concentration:.1f}% of all products.\n"
+    "     Market shows healthy competition.",
+    "   • Market Concentration: Top 10 companies account for {concentration:.1f}% of all products.\n"
+    "     Market is highly concentrated.",
+)
+
+# Indexed low / neutral / high engagement; neutral produces no finding
+_ENGAGEMENT_FINDINGS = (
+    "   • Low Engagement: Average of {avg_reviews:.0f} reviews per product suggests opportunities "
+    "to increase\n     customer feedback collection.",
+    None,
+    "   • High Engagement: Average of {avg_reviews:.0f} reviews per product indicates strong "
+    "customer engagement.\n     Leverage reviews for marketing and product improvement.",
+)
+
+
+def _describe_correlation(corr: float) -> Tuple[str, str, str]:
+    """
+    Classify an overall price/rating correlation for the report.
+    
+    A NaN coefficient (undefined correlation) is classed as weak/no correlation.
+    
+    Args:
+        corr: Pearson correlation coefficient
+        
+    Returns:
+        Tuple of (interpretation label, sign message line, Finding 1 template)
+    """
+    corr = float(corr)  # summary values may be numpy scalars
+    if math.isnan(corr):
+        # Too few rows or zero variance: every bisect comparison against NaN is
+        # False, which would land in the strong-negative band; report it as neutral
+        band = 2
+    else:
+        band = bisect.bisect_left(_CORR_THRESHOLDS, corr)
+    return _CORR_LABELS[band], _SIGN_MSGS[corr > 0], _CORR_FINDINGS[band]
+
+
+def _category_correlation(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute the price/rating Pearson correlation for each category.
+    
+    Uses the compiled kernel when Numba is available, otherwise one-pass
+    np.bincount reductions over the factorized category codes. Categories
+    with fewer than 3 rows or zero variance get NaN.
+    
+    Args:
+        df: DataFrame with category_name, price and avg_rating columns
+        
+    Returns:
+        DataFrame with category_name and correlation columns
+    """
+    codes, categories = pd.factorize(df['category_name'], sort=True)
+    x = df['price'].to_numpy(dtype=np.float64)
+    y = df['avg_rating'].to_numpy(dtype=np.float64)
+    n_groups = len(categories)
+    
+    if _kernels.HAVE_NUMBA:
+        correlation = _kernels.groupwise_pearson(codes.astype(np.int32), x, y, n_groups)
+    else:
+        # Per-group sums via bincount; centering on the group means keeps the
+        # closed-form Pearson numerically stable
+        n = np.bincount(codes, minlength=n_groups)
+        dx = x - (np.bincount(codes, weights=x, minlength=n_groups) / n)[codes]
+        dy = y - (np.bincount(codes, weights=y, minlength=n_groups) / n)[codes]
+        sxy = np.bincount(codes, weights=dx * dy, minlength=n_groups)
+        sxx = np.bincount(codes, weights=dx * dx, minlength=n_groups)
+        syy = np.bincount(codes, weights=dy * dy, minlength=n_groups)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlation = sxy / np.sqrt(sxx * syy)
+        correlation[(n < 3) | (sxx <= 0) | (syy <= 0)] = np.nan
+    
+    return pd.DataFrame({'category_name': categories, 'correlation': correlation})
+
 
 class EcommerceAnalytics:
     """Analytics class for e-commerce ETL data."""
@@ -72,6 +231,43 @@ class EcommerceAnalytics:
             self.connection.close()
             logger.info("Database connection closed")
     
+    def _stream_cursor(self):
+        """Return an unbuffered cursor that streams rows from the server."""
+        return self.connection.cursor(buffered=False)
+    
+    def _read_sql_batched(self, query: str) -> pd.DataFrame:
+        """
+        Run a row-level query and build a DataFrame from fetchmany() batches.
+        
+        Only one batch of raw tuples is held in Python at a time, instead of
+        the full result list that fetchall() (and pd.read_sql) materializes.
+        
+        Args:
+            query: SQL query to execute
+            
+        Returns:
+            DataFrame with one column per selected field
+        """
+        cursor = self._stream_cursor()
+        try:
+            cursor.execute(query)
+            columns = [col[0] for col in cursor.description]
+            frames = []
+            while True:
+                rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+                if not rows:
+                    break
+                # coerce_float matches pd.read_sql's Decimal -> float conversion
+                frames.append(pd.DataFrame.from_records(rows, columns=columns, coerce_float=True))
+        finally:
+            cursor.close()
+        
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        # A batch whose values are all NULL comes back as object dtype and would
+        # turn the whole concatenated column into object; re-infer the types
+        return pd.concat(frames, ignore_index=True).infer_objects()
+    
     # ================================================================
     # BASIC PROFILING
     # ================================================================
@@ -85,37 +281,32 @@ class EcommerceAnalytics:
         """
         logger.info("Running basic profiling analysis...")
         
-        profiling = {}
-        
-        # Total products
-        query_products = "SELECT COUNT(*) as total FROM products"
-        df = pd.read_sql(query_products, self.connection)
-        profiling['total_products'] = int(df['total'].iloc[0])
-        
-        # Distinct companies
-        query_companies = "SELECT COUNT(DISTINCT company_id) as total FROM products WHERE company_id IS NOT NULL"
-        df = pd.read_sql(query_companies, self.connection)
-        profiling['distinct_companies'] = int(df['total'].iloc[0])
-        
-        # Distinct categories
-        query_categories = "SELECT COUNT(DISTINCT category_id) as total FROM products WHERE category_id IS NOT NULL"
-        df = pd.read_sql(query_categories, self.connection)
-        profiling['distinct_categories'] = int(df['total'].iloc[0])
-        
-        # Products with prices
-        query_priced = "SELECT COUNT(*) as total FROM products WHERE price IS NOT NULL AND price > 0"
-        df = pd.read_sql(query_priced, self.connection)
-        profiling['products_with_price'] = int(df['total'].iloc[0])
-        
-        # Products with ratings
-        query_rated = "SELECT COUNT(*) as total FROM product_metrics WHERE avg_rating IS NOT NULL"
-        df = pd.read_sql(query_rated, self.connection)
-        profiling['products_with_rating'] = int(df['total'].iloc[0])
+        # All profiling metrics are scalar aggregates, fetched in one round-trip
+        query = """
+            SELECT 
+                (SELECT COUNT(*) FROM products) as total_products,
+                (SELECT COUNT(DISTINCT company_id) FROM products WHERE company_id IS NOT NULL) as distinct_companies,
+                (SELECT COUNT(DISTINCT category_id) FROM products WHERE category_id IS NOT NULL) as distinct_categories,
+                (SELECT COUNT(*) FROM products WHERE price IS NOT NULL AND price > 0) as products_with_price,
+                (SELECT COUNT(*) FROM product_metrics WHERE avg_rating IS NOT NULL) as products_with_rating,
+                (SELECT AVG(reviews_count) FROM product_metrics) as avg_reviews
+        """
         
-        # Average reviews per product
-        query_avg_reviews = "SELECT AVG(reviews_count) as avg_reviews FROM product_metrics"
-        df = pd.read_sql(query_avg_reviews, self.connection)
-        profiling['avg_reviews_per_product'] = float(df['avg_reviews'].iloc[0]) if df['avg_reviews'].iloc[0] else 0.0
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(query)
+            total, companies, categories, priced, rated, avg_reviews = cursor.fetchone()
+        finally:
+            cursor.close()
+        
+        profiling = {
+            'total_products': int(total),
+            'distinct_companies': int(companies),
+            'distinct_categories': int(categories),
+            'products_with_price': int(priced),
+            'products_with_rating': int(rated),
+            'avg_reviews_per_product': float(avg_reviews) if avg_reviews else 0.0,
+        }
         
         logger.info(f"Profiling complete: {profiling['total_products']} products analyzed")
         self.analytics_results['profiling'] = profiling
@@ -202,6 +393,9 @@ class EcommerceAnalytics:
         """
         logger.info("Analyzing price and rating insights...")
         
+        # Median is computed server-side with window functions (MySQL 8+): the
+        # one or two middle rows of each category are averaged, so only the
+        # per-category result set is transferred instead of every price
         query = """
             SELECT 
                 c.category_name,
@@ -211,36 +405,33 @@ class EcommerceAnalytics:
                 MIN(p.price) as min_price,
                 MAX(p.price) as max_price,
                 ROUND(AVG(pm.avg_rating), 2) as avg_rating,
-                ROUND(AVG(pm.reviews_count), 0) as avg_reviews
+                ROUND(AVG(pm.reviews_count), 0) as avg_reviews,
+                m.median_price
             FROM categories c
             JOIN products p ON c.category_id = p.category_id
             LEFT JOIN product_metrics pm ON p.product_id = pm.product_id
+            LEFT JOIN (
+                SELECT category_id, ROUND(AVG(price), 2) as median_price
+                FROM (
+                    SELECT 
+                        category_id,
+                        price,
+                        ROW_NUMBER() OVER (PARTITION BY category_id ORDER BY price) as rn,
+                        COUNT(*) OVER (PARTITION BY category_id) as cnt
+                    FROM products
+                    WHERE price IS NOT NULL AND price > 0
+                ) ranked
+                WHERE rn IN (FLOOR((cnt + 1) / 2), FLOOR((cnt + 2) / 2))
+                GROUP BY category_id
+            ) m ON m.category_id = c.category_id
             WHERE p.price IS NOT NULL AND p.price > 0
-            GROUP BY c.category_id, c.category_name
+            GROUP BY c.category_id, c.category_name, m.median_price
             HAVING product_count >= 5
             ORDER BY product_count DESC
         """
         
         df = pd.read_sql(query, self.connection)
         
-        # Calculate median (since SQL doesn't have easy median)
-        median_query = """
-            SELECT 
-                c.category_name,
-                p.price
-            FROM categories c
-            JOIN products p ON c.category_id = p.category_id
-            WHERE p.price IS NOT NULL AND p.price > 0
-            ORDER BY c.category_name, p.price
-        """
-        
-        price_df = pd.read_sql(median_query, self.connection)
-        medians = price_df.groupby('category_name')['price'].median().reset_index()
-        medians.columns = ['category_name', 'median_price']
-        
-        df = df.merge(medians, on='category_name', how='left')
-        df['median_price'] = df['median_price'].round(2)
-        
         logger.info(f"Price/rating analysis complete for {len(df)} categories")
         self.analytics_results['price_rating_insights'] = df
         
@@ -314,11 +505,14 @@ class EcommerceAnalytics:
             JOIN products p ON c.category_id = p.category_id
             WHERE p.price IS NOT NULL AND p.price > 0
         """
-        price_detail_df = pd.read_sql(price_detail_query, self.connection)
+        price_detail_df = self._read_sql_batched(price_detail_query)
+        price_detail_df['category_name'] = price_detail_df['category_name'].astype('category')
         
         # Filter to top categories
         top_categories = top_df['category_name'].tolist()[:8]  # Top 8 for readability
         filtered_df = price_detail_df[price_detail_df['category_name'].isin(top_categories)]
+        # Drop filtered-out categories so the box plot has no empty groups
+        filtered_df = filtered_df.assign(category_name=filtered_df['category_name'].cat.remove_unused_categories())
         
         if not filtered_df.empty:
             filtered_df.boxplot(column='price', by='category_name', ax=ax4, rot=45)
@@ -413,17 +607,16 @@ class EcommerceAnalytics:
                 AND pm.avg_rating IS NOT NULL
         """
         
-        df = pd.read_sql(query, self.connection)
+        df = self._read_sql_batched(query)
+        # Row-level frame: integer category codes make the per-category grouping cheap
+        df['category_name'] = df['category_name'].astype('category')
         
         # Overall correlation
         overall_corr = df['price'].corr(df['avg_rating'])
         
-        # Correlation by category
-        category_corr = df.groupby('category_name').apply(
-            lambda x: x['price'].corr(x['avg_rating']) if len(x) > 2 else np.nan
-        ).reset_index()
-        category_corr.columns = ['category_name', 'correlation']
-        category_corr = category_corr.dropna()
+        # Correlation by category, from the rows already in df; the chart uses
+        # the same helper, so report and plot always agree
+        category_corr = _category_correlation(df).dropna()
         category_corr = category_corr.sort_values('correlation', ascending=False)
         
         # Price segments analysis
@@ -509,10 +702,7 @@ class EcommerceAnalytics:
         
         # 3. Correlation by category
         ax3 = axes[1, 0]
-        category_corr = df.groupby('category_name').apply(
-            lambda x: x['price'].corr(x['avg_rating']) if len(x) > 2 else np.nan
-        ).reset_index()
-        category_corr.columns = ['category_name', 'correlation']
+        category_corr = _category_correlation(df)
         category_corr = category_corr.dropna().sort_values('correlation', ascending=True).tail(10)
         
         colors = ['red' if x < 0 else 'green' for x in category_corr['correlation']]
@@ -708,284 +898,261 @@ class EcommerceAnalytics:
         """
         logger.info("Generating comprehensive analytics report...")
         
-        report_lines = []
-        report_lines.append("=" * 100)
-        report_lines.append(" " * 30 + "E-COMMERCE ETL ANALYTICS REPORT")
-        report_lines.append(" " * 35 + f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append("=" * 100)
-        report_lines.append("")
+        # Bind the section results once; each is None when its analysis was not run
+        results = self.analytics_results
+        prof = results.get('profiling')
+        cat_df = results.get('category_distribution')
+        price_df = results.get('price_rating_insights')
+        corr_data = results.get('correlation')
+        comp_df = results.get('company_insights')
+        
+        # Scalars reused by the key findings, filled in as each section is written
+        findings_ctx = {}
+        
+        buf = io.StringIO()
+        write = buf.write
+        write(_REPORT_HEADER.format(datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
         
         # ================================================================
         # 1. BASIC PROFILING
         # ================================================================
         
-        if 'profiling' in self.analytics_results:
-            prof = self.analytics_results['profiling']
-            report_lines.append("=" * 100)
-            report_lines.append("1. BASIC PROFILING")
-            report_lines.append("=" * 100)
-            report_lines.append("")
-            report_lines.append(f"   Total Products:              {prof['total_products']:>10,}")
-            report_lines.append(f"   Distinct Companies:          {prof['distinct_companies']:>10,}")
-            report_lines.append(f"   Distinct Categories:         {prof['distinct_categories']:>10,}")
-            report_lines.append(f"   Products with Price:         {prof['products_with_price']:>10,} ({prof['products_with_price']/prof['total_products']*100:.1f}%)")
-            report_lines.append(f"   Products with Rating:        {prof['products_with_rating']:>10,} ({prof['products_with_rating']/prof['total_products']*100:.1f}%)")
-            report_lines.append(f"   Avg Reviews per Product:     {prof['avg_reviews_per_product']:>10,.1f}")
-            report_lines.append("")
+        if prof is not None:
+            write(_SECTION_HEADER.format("1. BASIC PROFILING"))
+            write(f"   Total Products:              {prof['total_products']:>10,}\n")
+            write(f"   Distinct Companies:          {prof['distinct_companies']:>10,}\n")
+            write(f"   Distinct Categories:         {prof['distinct_categories']:>10,}\n")
+            write(f"   Products with Price:         {prof['products_with_price']:>10,} ({prof['products_with_price']/prof['total_products']*100:.1f}%)\n")
+            write(f"   Products with Rating:        {prof['products_with_rating']:>10,} ({prof['products_with_rating']/prof['total_products']*100:.1f}%)\n")
+            write(f"   Avg Reviews per Product:     {prof['avg_reviews_per_product']:>10,.1f}\n")
+            write("\n")
+            findings_ctx['avg_reviews'] = prof['avg_reviews_per_product']
         
         # ================================================================
         # 2. CATEGORY DISTRIBUTION
         # ================================================================
         
-        if 'category_distribution' in self.analytics_results:
-            cat_df = self.analytics_results['category_distribution']
-            report_lines.append("=" * 100)
-            report_lines.append("2. PRODUCT DISTRIBUTION BY CATEGORY (Top 10)")
-            report_lines.append("=" * 100)
-            report_lines.append("")
-            report_lines.append(f"   {'Category':<35} {'Product Count':>15} {'Percentage':>15}")
-            report_lines.append("   " + "-" * 65)
+        if cat_df is not None:
+            write(_SECTION_HEADER.format("2. PRODUCT DISTRIBUTION BY CATEGORY (Top 10)"))
+            write(f"   {'Category':<35} {'Product Count':>15} {'Percentage':>15}\n")
+            write(_SEP_65)
             
-            for idx, row in cat_df.iterrows():
-                report_lines.append(f"   {row['category_name']:<35} {int(row['product_count']):>15,} {row['percentage']:>14.2f}%")
-            report_lines.append("")
+            # Each table is rendered by one str.join over a generator and written once
+            row_fmt = _CATEGORY_ROW.format_map
+            write("".join(
+                row_fmt({'category_name': cat, 'product_count': int(cnt), 'percentage': pct})
+                for cat, cnt, pct in cat_df[['category_name', 'product_count', 'percentage']].itertuples(index=False, name=None)
+            ))
+            write("\n")
+            findings_ctx['top_cat'] = cat_df['category_name'].iat[0]
+            findings_ctx['top_cat_pct'] = cat_df['percentage'].iat[0]
         
         # ================================================================
         # 3. PRICE AND RATING INSIGHTS
         # ================================================================
         
-        if 'price_rating_insights' in self.analytics_results:
-            price_df = self.analytics_results['price_rating_insights']
-            report_lines.append("=" * 100)
-            report_lines.append("3. PRICE AND RATING INSIGHTS BY CATEGORY")
-            report_lines.append("=" * 100)
-            report_lines.append("")
-            report_lines.append(f"   {'Category':<20} {'Count':>8} {'Avg $':>10} {'Med $':>10} {'Min $':>10} {'Max $':>10} {'Avg Rating':>12}")
-            report_lines.append("   " + "-" * 90)
+        if price_df is not None:
+            write(_SECTION_HEADER.format("3. PRICE AND RATING INSIGHTS BY CATEGORY"))
+            write(f"   {'Category':<20} {'Count':>8} {'Avg $':>10} {'Med $':>10} {'Min $':>10} {'Max $':>10} {'Avg Rating':>12}\n")
+            write(_SEP_90)
             
-            for idx, row in price_df.head(10).iterrows():
-                report_lines.append(
-                    f"   {row['category_name']:<20} "
-                    f"{int(row['product_count']):>8,} "
-                    f"${row['avg_price']:>9.2f} "
-                    f"${row['median_price']:>9.2f} "
-                    f"${row['min_price']:>9.2f} "
-                    f"${row['max_price']:>9.2f} "
-                    f"{row['avg_rating'] if pd.notna(row['avg_rating']) else 'N/A':>12}"
-                )
-            report_lines.append("")
+            # Pull the top rows out as a plain ndarray and resolve missing ratings once
+            price_rows = price_df[['category_name', 'product_count', 'avg_price', 'median_price',
+                                   'min_price', 'max_price', 'avg_rating']].head(10).to_numpy()
+            price_rows[:, 6] = np.where(pd.isna(price_rows[:, 6]), 'N/A', price_rows[:, 6])
+            
+            row_fmt = _PRICE_ROW.format_map
+            write("".join(
+                row_fmt({
+                    'category_name': cat,
+                    'product_count': int(cnt),
+                    'avg_price': avg_price,
+                    'median_price': med_price,
+                    'min_price': min_price,
+                    'max_price': max_price,
+                    'avg_rating': rating,
+                })
+                for cat, cnt, avg_price, med_price, min_price, max_price, rating in price_rows
+            ))
+            write("\n")
             
             # Price summary statistics
-            report_lines.append("   PRICE SUMMARY STATISTICS:")
-            report_lines.append("   " + "-" * 40)
-            report_lines.append(f"   Overall Average Price:       ${price_df['avg_price'].mean():>10.2f}")
-            report_lines.append(f"   Overall Median Price:        ${price_df['median_price'].median():>10.2f}")
-            report_lines.append(f"   Highest Category Avg:        ${price_df['avg_price'].max():>10.2f} ({price_df.loc[price_df['avg_price'].idxmax(), 'category_name']})")
-            report_lines.append(f"   Lowest Category Avg:         ${price_df['avg_price'].min():>10.2f} ({price_df.loc[price_df['avg_price'].idxmin(), 'category_name']})")
-            report_lines.append("")
+            write("   PRICE SUMMARY STATISTICS:\n")
+            write(_SEP_40)
+            # Reduce on the raw arrays and resolve category names by position (.iat),
+            # which skips index-label lookups entirely
+            cat_col = price_df.columns.get_loc('category_name')
+            avg_prices = price_df['avg_price'].to_numpy(dtype=np.float64)
+            i_max, i_min = int(np.nanargmax(avg_prices)), int(np.nanargmin(avg_prices))
+            write(f"   Overall Average Price:       ${np.nanmean(avg_prices):>10.2f}\n")
+            write(f"   Overall Median Price:        ${price_df['median_price'].median():>10.2f}\n")
+            write(f"   Highest Category Avg:        ${avg_prices[i_max]:>10.2f} ({price_df.iat[i_max, cat_col]})\n")
+            write(f"   Lowest Category Avg:         ${avg_prices[i_min]:>10.2f} ({price_df.iat[i_min, cat_col]})\n")
+            write("\n")
             
             # Rating summary statistics
-            report_lines.append("   RATING SUMMARY STATISTICS:")
-            report_lines.append("   " + "-" * 40)
-            valid_ratings = price_df[price_df['avg_rating'].notna()]
-            if not valid_ratings.empty:
-                report_lines.append(f"   Overall Average Rating:      {valid_ratings['avg_rating'].mean():>10.2f}")
-                report_lines.append(f"   Highest Rated Category:      {valid_ratings['avg_rating'].max():>10.2f} ({valid_ratings.loc[valid_ratings['avg_rating'].idxmax(), 'category_name']})")
-                report_lines.append(f"   Lowest Rated Category:       {valid_ratings['avg_rating'].min():>10.2f} ({valid_ratings.loc[valid_ratings['avg_rating'].idxmin(), 'category_name']})")
-            report_lines.append("")
+            write("   RATING SUMMARY STATISTICS:\n")
+            write(_SEP_40)
+            ratings = price_df['avg_rating'].to_numpy(dtype=np.float64)
+            if not np.isnan(ratings).all():
+                i_max, i_min = int(np.nanargmax(ratings)), int(np.nanargmin(ratings))
+                write(f"   Overall Average Rating:      {np.nanmean(ratings):>10.2f}\n")
+                write(f"   Highest Rated Category:      {ratings[i_max]:>10.2f} ({price_df.iat[i_max, cat_col]})\n")
+                write(f"   Lowest Rated Category:       {ratings[i_min]:>10.2f} ({price_df.iat[i_min, cat_col]})\n")
+            write("\n")
         
         # ================================================================
         # 4. PRICE-RATING CORRELATION
         # ================================================================
         
-        if 'correlation' in self.analytics_results:
-            corr_data = self.analytics_results['correlation']
+        if corr_data is not None:
             summary = corr_data['summary']
             
-            report_lines.append("=" * 100)
-            report_lines.append("4. PRICE-RATING CORRELATION ANALYSIS")
-            report_lines.append("=" * 100)
-            report_lines.append("")
-            report_lines.append("   CORRELATION INSIGHTS:")
-            report_lines.append("   " + "-" * 60)
-            report_lines.append(f"   Overall Correlation Coefficient:           {summary['overall_correlation']:>8.3f}")
-            report_lines.append("")
-            
-            if summary['overall_correlation'] > 0.3:
-                interpretation = "Strong positive correlation"
-            elif summary['overall_correlation'] > 0.1:
-                interpretation = "Moderate positive correlation"
-            elif summary['overall_correlation'] > -0.1:
-                interpretation = "Weak/no correlation"
-            elif summary['overall_correlation'] > -0.3:
-                interpretation = "Moderate negative correlation"
-            else:
-                interpretation = "Strong negative correlation"
+            write(_SECTION_HEADER.format("4. PRICE-RATING CORRELATION ANALYSIS"))
+            write("   CORRELATION INSIGHTS:\n")
+            write(_SEP_60)
+            write(f"   Overall Correlation Coefficient:           {summary['overall_correlation']:>8.3f}\n")
+            write("\n")
             
-            report_lines.append(f"   Interpretation: {interpretation}")
-            report_lines.append("")
+            corr_label, sign_msg, corr_finding = _describe_correlation(summary['overall_correlation'])
+            findings_ctx['corr'] = summary['overall_correlation']
+            write(f"   Interpretation: {corr_label}\n")
+            write("\n")
+            write(sign_msg)
+            write("\n")
             
-            if summary['overall_correlation'] > 0:
-                report_lines.append("   ✓ Higher-priced products tend to have HIGHER ratings")
-            else:
-                report_lines.append("   ✗ Higher-priced products tend to have LOWER ratings")
-            report_lines.append("")
-            
-            report_lines.append(f"   Categories with Positive Correlation:      {summary['positive_correlation_categories']:>8}")
-            report_lines.append(f"   Categories with Negative Correlation:      {summary['negative_correlation_categories']:>8}")
-            report_lines.append("")
+            write(f"   Categories with Positive Correlation:      {summary['positive_correlation_categories']:>8}\n")
+            write(f"   Categories with Negative Correlation:      {summary['negative_correlation_categories']:>8}\n")
+            write("\n")
             
             if summary['strongest_positive']:
-                report_lines.append("   Strongest Positive Correlation:")
-                report_lines.append(f"      Category: {summary['strongest_positive']['category_name']}")
-                report_lines.append(f"      Correlation: {summary['strongest_positive']['correlation']:.3f}")
+                write("   Strongest Positive Correlation:\n")
+                write(f"      Category: {summary['strongest_positive']['category_name']}\n")
+                write(f"      Correlation: {summary['strongest_positive']['correlation']:.3f}\n")
             
             if summary['strongest_negative']:
-                report_lines.append("")
-                report_lines.append("   Strongest Negative Correlation:")
-                report_lines.append(f"      Category: {summary['strongest_negative']['category_name']}")
-                report_lines.append(f"      Correlation: {summary['strongest_negative']['correlation']:.3f}")
-            report_lines.append("")
+                write("\n")
+                write("   Strongest Negative Correlation:\n")
+                write(f"      Category: {summary['strongest_negative']['category_name']}\n")
+                write(f"      Correlation: {summary['strongest_negative']['correlation']:.3f}\n")
+            write("\n")
             
             # Price segment analysis
             if 'segment_stats' in corr_data:
-                report_lines.append("   PRICE SEGMENT ANALYSIS:")
-                report_lines.append("   " + "-" * 60)
+                write("   PRICE SEGMENT ANALYSIS:\n")
+                write(_SEP_60)
                 segment_df = corr_data['segment_stats']
-                report_lines.append(f"   {'Segment':<15} {'Avg Rating':>12} {'Product Count':>15} {'Avg Price':>12}")
-                report_lines.append("   " + "-" * 60)
+                write(f"   {'Segment':<15} {'Avg Rating':>12} {'Product Count':>15} {'Avg Price':>12}\n")
+                write(_SEP_60)
                 
-                for segment in segment_df.index:
-                    avg_rating = segment_df.loc[segment, ('avg_rating', 'mean')]
-                    count = segment_df.loc[segment, ('avg_rating', 'count')]
-                    avg_price = segment_df.loc[segment, ('price', 'mean')]
-                    report_lines.append(f"   {segment:<15} {avg_rating:>12.2f} {int(count):>15,} ${avg_price:>11.2f}")
-            report_lines.append("")
+                row_fmt = _SEGMENT_ROW.format_map
+                write("".join(
+                    row_fmt({'segment': segment, 'avg_rating': avg_rating, 'count': int(count), 'avg_price': avg_price})
+                    for segment, avg_rating, count, avg_price in zip(
+                        segment_df.index,
+                        segment_df[('avg_rating', 'mean')],
+                        segment_df[('avg_rating', 'count')],
+                        segment_df[('price', 'mean')],
+                    )
+                ))
+            write("\n")
         
         # ================================================================
         # 5. COMPANY INSIGHTS
         # ================================================================
         
-        if 'company_insights' in self.analytics_results:
-            comp_df = self.analytics_results['company_insights']
-            report_lines.append("=" * 100)
-            report_lines.append("5. COMPANY-LEVEL INSIGHTS (Top 10 by Product Count)")
-            report_lines.append("=" * 100)
-            report_lines.append("")
-            report_lines.append(f"   {'Company':<25} {'Products':>10} {'Avg Rating':>12} {'Total Reviews':>15} {'Avg Reviews/Product':>20}")
-            report_lines.append("   " + "-" * 82)
+        if comp_df is not None:
+            write(_SECTION_HEADER.format("5. COMPANY-LEVEL INSIGHTS (Top 10 by Product Count)"))
+            write(f"   {'Company':<25} {'Products':>10} {'Avg Rating':>12} {'Total Reviews':>15} {'Avg Reviews/Product':>20}\n")
+            write(_SEP_82)
+            
+            company_rows = comp_df[['company_name', 'product_count', 'avg_rating',
+                                    'total_reviews', 'avg_reviews_per_product']].head(10)
+            
+            # Resolve missing values column-wise once instead of testing each cell
+            ratings = company_rows['avg_rating'].to_numpy(dtype=object)
+            ratings[company_rows['avg_rating'].isna().to_numpy()] = 'N/A'
+            total_reviews = company_rows['total_reviews'].fillna(0).to_numpy()
+            avg_reviews = company_rows['avg_reviews_per_product'].fillna(0).to_numpy()
             
-            for idx, row in comp_df.head(10).iterrows():
-                report_lines.append(
-                    f"   {row['company_name'][:24]:<25} "
-                    f"{int(row['product_count']):>10,} "
-                    f"{row['avg_rating'] if pd.notna(row['avg_rating']) else 'N/A':>12} "
-                    f"{int(row['total_reviews']) if pd.notna(row['total_reviews']) else 0:>15,} "
-                    f"{int(row['avg_reviews_per_product']) if pd.notna(row['avg_reviews_per_product']) else 0:>20,}"
+            row_fmt = _COMPANY_ROW.format_map
+            write("".join(
+                row_fmt({
+                    'company_name': name[:24],
+                    'product_count': int(cnt),
+                    'avg_rating': rating,
+                    'total_reviews': int(total),
+                    'avg_reviews_per_product': int(avg),
+                })
+                for name, cnt, rating, total, avg in zip(
+                    company_rows['company_name'], company_rows['product_count'],
+                    ratings, total_reviews, avg_reviews
                 )
-            report_lines.append("")
+            ))
+            write("\n")
+            findings_ctx['concentration'] = float(company_rows['product_count'].sum()) / prof['total_products'] * 100
             
             # Company performance metrics
-            report_lines.append("   COMPANY PERFORMANCE METRICS:")
-            report_lines.append("   " + "-" * 60)
+            write("   COMPANY PERFORMANCE METRICS:\n")
+            write(_SEP_60)
             
-            top_company = comp_df.iloc[0]
-            report_lines.append(f"   Most Prolific Company:       {top_company['company_name']} ({int(top_company['product_count'])} products)")
+            name_col = comp_df.columns.get_loc('company_name')
+            write(f"   Most Prolific Company:       {comp_df.iat[0, name_col]} ({int(comp_df['product_count'].iat[0])} products)\n")
             
             if 'avg_rating' in comp_df.columns and comp_df['avg_rating'].notna().any():
-                highest_rated = comp_df.loc[comp_df['avg_rating'].idxmax()]
-                report_lines.append(f"   Highest Rated Company:       {highest_rated['company_name']} ({highest_rated['avg_rating']:.2f})")
+                company_ratings = comp_df['avg_rating'].to_numpy(dtype=np.float64)
+                i_max = int(np.nanargmax(company_ratings))
+                write(f"   Highest Rated Company:       {comp_df.iat[i_max, name_col]} ({company_ratings[i_max]:.2f})\n")
             
             if 'total_reviews' in comp_df.columns and comp_df['total_reviews'].notna().any():
-                most_reviewed = comp_df.loc[comp_df['total_reviews'].idxmax()]
-                report_lines.append(f"   Most Reviewed Company:       {most_reviewed['company_name']} ({int(most_reviewed['total_reviews']):,} reviews)")
+                company_reviews = comp_df['total_reviews'].to_numpy(dtype=np.float64)
+                i_max = int(np.nanargmax(company_reviews))
+                write(f"   Most Reviewed Company:       {comp_df.iat[i_max, name_col]} ({int(company_reviews[i_max]):,} reviews)\n")
             
-            report_lines.append("")
+            write("\n")
         
         # ================================================================
         # 6. KEY FINDINGS & RECOMMENDATIONS
         # ================================================================
         
-        report_lines.append("=" * 100)
-        report_lines.append("6. KEY FINDINGS & RECOMMENDATIONS")
-        report_lines.append("=" * 100)
-        report_lines.append("")
+        write(_SECTION_HEADER.format("6. KEY FINDINGS & RECOMMENDATIONS"))
         
         findings = []
         
         # Finding 1: Price-Rating correlation
-        if 'correlation' in self.analytics_results:
-            corr_val = self.analytics_results['correlation']['summary']['overall_correlation']
-            if corr_val > 0.1:
-                findings.append(
-                    f"   • Price-Quality Signal: Positive correlation ({corr_val:.3f}) suggests customers "
-                    "perceive higher-priced\n     products as better quality. Premium pricing strategy may be justified."
-                )
-            elif corr_val < -0.1:
-                findings.append(
-                    f"   • Value Perception: Negative correlation ({corr_val:.3f}) indicates customers find "
-                    "better value in\n     lower-priced products. Consider value-based pricing strategies."
-                )
-            else:
-                findings.append(
-                    f"   • Price Independence: Weak correlation ({corr_val:.3f}) shows price and quality are "
-                    "largely independent.\n     Focus on product differentiation beyond price."
-                )
+        if corr_data is not None:
+            findings.append(corr_finding)
         
         # Finding 2: Category concentration
-        if 'category_distribution' in self.analytics_results:
-            cat_df = self.analytics_results['category_distribution']
-            top_cat_pct = cat_df.iloc[0]['percentage']
-            if top_cat_pct > 30:
-                findings.append(
-                    f"   • Category Concentration: {cat_df.iloc[0]['category_name']} dominates with "
-                    f"{top_cat_pct:.1f}% of products.\n     Consider diversification or capitalize on this strength."
-                )
+        if cat_df is not None and findings_ctx['top_cat_pct'] > 30:
+            findings.append(_CATEGORY_FINDING)
         
         # Finding 3: Company market presence
-        if 'company_insights' in self.analytics_results:
-            comp_df = self.analytics_results['company_insights']
-            top_companies_products = comp_df.head(10)['product_count'].sum()
-            total_products = self.analytics_results['profiling']['total_products']
-            concentration = (top_companies_products / total_products) * 100
-            
-            findings.append(
-                f"   • Market Concentration: Top 10 companies account for {concentration:.1f}% of all products.\n"
-                f"     {'Market is highly concentrated.' if concentration > 50 else 'Market shows healthy competition.'}"
-            )
+        if comp_df is not None:
+            findings.append(_MARKET_FINDINGS[findings_ctx['concentration'] > 50])
         
         # Finding 4: Review engagement
-        if 'profiling' in self.analytics_results:
-            avg_reviews = self.analytics_results['profiling']['avg_reviews_per_product']
-            if avg_reviews > 100:
-                findings.append(
-                    f"   • High Engagement: Average of {avg_reviews:.0f} reviews per product indicates strong "
-                    "customer engagement.\n     Leverage reviews for marketing and product improvement."
-                )
-            elif avg_reviews < 10:
-                findings.append(
-                    f"   • Low Engagement: Average of {avg_reviews:.0f} reviews per product suggests opportunities "
-                    "to increase\n     customer feedback collection."
-                )
+        if prof is not None:
+            avg_reviews = findings_ctx['avg_reviews']
+            engagement = _ENGAGEMENT_FINDINGS[2 if avg_reviews > 100 else 0 if avg_reviews < 10 else 1]
+            if engagement is not None:
+                findings.append(engagement)
         
-        for finding in findings:
-            report_lines.append(finding)
-            report_lines.append("")
+        for template in findings:
+            write(template.format_map(findings_ctx))
+            write("\n\n")
         
         # ================================================================
         # FOOTER
         # ================================================================
         
-        report_lines.append("=" * 100)
-        report_lines.append("END OF REPORT")
-        report_lines.append("=" * 100)
+        write(_REPORT_FOOTER)
         
-        # Join all lines
-        report_content = "\n".join(report_lines)
+        report_content = buf.getvalue()
         
-        # Save to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+        # Save to file: encode once and hand the bytes to a single write()
+        with open(output_file, 'wb') as f:
+            f.write(report_content.encode('utf-8'))
         
         logger.info(f"Analytics report saved to {output_file}")
         
@@ -995,6 +1162,28 @@ class EcommerceAnalytics:
     # MASTER ANALYSIS FUNCTION
     # ================================================================
     
+    def _run_step(self, step: str):
+        """
+        Run one analysis step on its own database connection.
+        
+        The worker shares this instance's analytics_results dict; each step
+        writes a distinct key, so the results land in one place. The
+        connection is closed as soon as the step finishes.
+        
+        Args:
+            step: Name of the analysis method to run
+            
+        Returns:
+            The analysis method's return value
+        """
+        worker = EcommerceAnalytics(self.db_config)
+        worker.analytics_results = self.analytics_results
+        worker.connection = mysql.connector.connect(**self.db_config)
+        try:
+            return getattr(worker, step)()
+        finally:
+            worker.connection.close()
+    
     def run_complete_analysis(self):
         """Run all analytics and generate visualizations and report."""
         logger.info("=" * 60)
@@ -1006,31 +1195,33 @@ class EcommerceAnalytics:
             return False
         
         try:
-            # 1. Basic Profiling
-            profiling = self.basic_profiling()
+            # 1-5. Run the independent SQL analyses concurrently
+            with ThreadPoolExecutor(max_workers=len(ANALYSIS_STEPS)) as executor:
+                futures = {step: executor.submit(self._run_step, step) for step in ANALYSIS_STEPS}
+                results = {step: future.result() for step, future in futures.items()}
             
-            # 2. Category Distribution
-            cat_df = self.category_distribution()
-            self.visualize_category_distribution(cat_df)
+            # Visualizations stay on the main thread (matplotlib is not thread-safe)
+            self.visualize_category_distribution(results['category_distribution'])
             
-            # 3. Price and Rating Insights
-            price_rating_df = self.price_rating_insights()
+            price_rating_df = results['price_rating_insights']
             self.visualize_price_insights(price_rating_df)
             self.visualize_rating_insights(price_rating_df)
             
-            # 4. Price-Rating Correlation
-            corr_df, corr_summary = self.price_rating_correlation()
+            corr_df, corr_summary = results['price_rating_correlation']
             self.visualize_price_rating_correlation(corr_df)
             
-            # 5. Company Insights
-            company_df = self.company_insights()
-            self.visualize_company_insights(company_df)
+            self.visualize_company_insights(results['company_insights'])
             
             # 6. Generate Report
-            report = self.generate_analytics_report()
+            report_file = 'analytics_report.txt'
+            self.generate_analytics_report(report_file)
             
-            # Print report to console
-            print("\n" + report)
+            # Print report to console by streaming the saved file, rather than
+            # holding a second full copy of the report string
+            print()
+            with open(report_file, 'r', encoding='utf-8') as f:
+                shutil.copyfileobj(f, sys.stdout)
+            print()
             
             logger.info("=" * 60)
             logger.info("ANALYTICS COMPLETED SUCCESSFULLY")
@@ -39,13 +39,13 @@ USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
 # CATEGORIES TO SCRAPE
 # ================================================================
 
-AMAZON_CATEGORIES = [
+AMAZON_CATEGORIES = (
     ('Electronics', 'https://www.amazon.com/best-sellers-electronics/zgbs/electronics'),
     ('Books', 'https://www.amazon.com/Best-Sellers-Books/zgbs/books'),
     ('Home & Kitchen', 'https://www.amazon.com/best-sellers-home-garden/zgbs/home-garden'),
     ('Toys & Games', 'https://www.amazon.com/Best-Sellers-Toys-Games/zgbs/toys-and-games'),
     ('Sports & Outdoors', 'https://www.amazon.com/Best-Sellers-Sports-Outdoors/zgbs/sporting-goods'),
-]
+)
 
 # ================================================================
 # LOGGING CONFIGURATION
@@ -61,8 +61,8 @@ LOG_FILE = None  # e.g., 'etl_pipeline.log'
 # DATA QUALITY SETTINGS
 # ================================================================
 
-# Minimum required fields for a valid product
-REQUIRED_FIELDS = ['product_id', 'name', 'url']
+# Minimum required fields for a valid product (frozenset for O(1) membership tests)
+REQUIRED_FIELDS = frozenset({'product_id', 'name', 'url'})
 
 # Price validation range (min, max in USD)
 PRICE_RANGE = (0.01, 1000000.00)
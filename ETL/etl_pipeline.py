@@ -13,17 +13,28 @@ Author: ETL Pipeline
 Date: 2026-01-27
 """
 
+import os
 import re
+import json
 import time
+import tempfile
+import asyncio
+import email.utils
 import logging
-from typing import List, Dict, Optional, Tuple
-from datetime import date, datetime
+from typing import AsyncIterator, List, Dict, Optional, Tuple
+from datetime import date, datetime, timezone
 from decimal import Decimal, InvalidOperation
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+from selectolax.lexbor import LexborHTMLParser
 import mysql.connector
 from mysql.connector import Error
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -32,6 +43,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Patterns used by the transform helpers, compiled once at import
+_WHITESPACE_RE = re.compile(r'\s+')
+_CURRENCY_TABLE = str.maketrans('', '', '$,€£')
+_NUMBER_RE = re.compile(r'[\d.]+')
+_INTEGER_RE = re.compile(r'\d+')
+
+# CSS selectors for the Best Sellers grid. [class*=...] matches class
+# tokens by substring, like the regex class filters these replaced.
+_PRODUCT_ITEM_SELECTOR = 'div[class*="zg-grid-general-faceout"], div[class*="p13n-sc-uncoverable-faceout"]'
+_ASIN_SELECTOR = 'div[data-asin]'
+_NAME_SELECTOR = 'div[class*="p13n-sc-truncate"], div[class*="_cDEzb_p13n-sc-css-line-clamp-3"]'
+_IMAGE_ALT_SELECTOR = 'img[alt]'
+_PRICE_SELECTOR = 'span[class*="p13n-sc-price"], span[class*="a-price-whole"]'
+_RATING_SELECTOR = 'span[class*="a-icon-alt"]'
+_LINK_SELECTOR = 'a[class*="a-size-small"], a[class*="a-link-normal"]'
+
+# HTTP statuses retried with backoff (rate limiting and transient server errors);
+# a Retry-After header on them is honoured, up to MAX_RETRY_AFTER seconds
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_AFTER = 60.0
+
+# Rows per multi-row INSERT statement; keeps each rewritten statement
+# well under max_allowed_packet however large the load is
+INSERT_BATCH_SIZE = 500
+
+# Product batches at least this large are bulk-loaded with LOAD DATA LOCAL
+# INFILE through a staging table instead of a multi-row INSERT
+BULK_LOAD_THRESHOLD = 5000
+
+# Escapes for LOAD DATA's default tab-separated format
+_TSV_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r', '\0': '\\0'})
+
 
 # ================================================================
 # DATA MODELS
@@ -40,6 +83,12 @@ logger = logging.getLogger(__name__)
 @dataclass
 class Product:
     """Data class representing a product record"""
+    # Declared explicitly (rather than dataclass(slots=True)) to stay 3.9-compatible
+    __slots__ = (
+        'product_id', 'name', 'category', 'company', 'description',
+        'price', 'url', 'reviews_count', 'avg_rating',
+    )
+    
     product_id: str
     name: str
     category: str
@@ -61,6 +110,9 @@ def extract_products(num_pages: int = 5, delay: int = 2) -> List[Dict]:
     
     This function scrapes multiple categories from Amazon's Best Sellers
     to gather at least 500 product records with relevant attributes.
+    All pages are fetched concurrently (see _fetch_pages) and each page
+    is parsed as soon as its body arrives; results are returned in
+    category/page order.
     
     Args:
         num_pages: Number of pages to scrape per category
@@ -68,9 +120,6 @@ def extract_products(num_pages: int = 5, delay: int = 2) -> List[Dict]:
     
     Returns:
         List of dictionaries containing raw product data
-    
-    Raises:
-        requests.RequestException: If HTTP request fails
     """
     logger.info("Starting data extraction from Amazon Best Sellers")
     
@@ -83,53 +132,222 @@ def extract_products(num_pages: int = 5, delay: int = 2) -> List[Dict]:
         ('Sports & Outdoors', 'https://www.amazon.com/Best-Sellers-Sports-Outdoors/zgbs/sporting-goods'),
     ]
     
-    all_products = []
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
         'Accept-Language': 'en-US,en;q=0.9',
     }
     
-    for category_name, base_url in categories:
-        logger.info(f"Scraping category: {category_name}")
-        
-        for page in range(1, num_pages + 1):
-            try:
-                # Construct URL with page parameter
-                url = f"{base_url}?pg={page}" if page > 1 else base_url
-                
-                # Make HTTP request
-                response = requests.get(url, headers=headers, timeout=10)
-                response.raise_for_status()
-                
-                # Parse HTML
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Extract products from page
-                products = _extract_products_from_page(soup, category_name, base_url)
-                all_products.extend(products)
-                
-                logger.info(f"Extracted {len(products)} products from {category_name} - Page {page}")
-                
-                # Respectful delay between requests
-                time.sleep(delay)
-                
-            except requests.RequestException as e:
-                logger.error(f"Error fetching {category_name} page {page}: {e}")
-                continue
-            except Exception as e:
-                logger.error(f"Unexpected error on {category_name} page {page}: {e}")
-                continue
+    # Construct every page URL up front so they can be fetched together
+    pages = [
+        (category_name, base_url, page, f"{base_url}?pg={page}" if page > 1 else base_url)
+        for category_name, base_url in categories
+        for page in range(1, num_pages + 1)
+    ]
+    
+    logger.info(f"Fetching {len(pages)} pages across {len(categories)} categories")
+    page_products = asyncio.run(_scrape_pages(pages, headers, delay))
+    
+    all_products = [product for products in page_products for product in products]
     
     logger.info(f"Extraction complete. Total products extracted: {len(all_products)}")
     return all_products
 
 
-def _extract_products_from_page(soup: BeautifulSoup, category: str, base_url: str) -> List[Dict]:
+async def _scrape_pages(
+    pages: List[Tuple[str, str, int, str]],
+    headers: Dict[str, str],
+    delay: float
+) -> List[List[Dict]]:
+    """
+    Fetch and parse pages, parsing each one while the rest download.
+    
+    Parsing runs on a worker thread (see _parse_page) so it never stalls
+    the event loop that is reading the remaining responses.
+    
+    Only the product dicts are kept; each page body is released once it
+    has been parsed, so memory holds the in-flight pages rather than the
+    whole crawl.
+    
+    Args:
+        pages: (category name, base URL, page number, URL) tuples
+        headers: HTTP headers sent with every request
+        delay: Delay between requests in seconds
+    
+    Returns:
+        Product dict lists aligned with `pages`
+    """
+    page_products = [[] for _ in pages]
+    
+    async for index, result in _fetch_pages([url for _, _, _, url in pages], headers, delay):
+        category_name, base_url, page, _ = pages[index]
+        
+        if isinstance(result, (aiohttp.ClientError, asyncio.TimeoutError)):
+            logger.error(f"Error fetching {category_name} page {page}: {result}")
+            continue
+        if isinstance(result, BaseException):
+            logger.error(f"Unexpected error on {category_name} page {page}: {result}")
+            continue
+        
+        try:
+            # Parse on a worker thread so the event loop keeps servicing
+            # the downloads still in flight
+            content, charset = result
+            products = await asyncio.to_thread(
+                _parse_page, content, charset, category_name, base_url
+            )
+            page_products[index] = products
+            
+            logger.info(f"Extracted {len(products)} products from {category_name} - Page {page}")
+            
+        except Exception as e:
+            logger.error(f"Unexpected error on {category_name} page {page}: {e}")
+            continue
+    
+    return page_products
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into a number of seconds to wait.
+    
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+    
+    Returns:
+        Seconds to wait, or None when the header is absent or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+async def _fetch_pages(
+    urls: List[str],
+    headers: Dict[str, str],
+    delay: float,
+    max_concurrency: int = 5,
+    max_retries: int = 3,
+    backoff_factor: float = 0.3
+) -> AsyncIterator[Tuple[int, object]]:
     """
-    Extract individual product data from a BeautifulSoup page object.
+    Fetch all page URLs concurrently over one aiohttp session.
+    
+    A semaphore caps the number of in-flight requests, and each slot
+    starts at most one request per `delay` seconds so the per-host
+    request rate stays polite. The pacing holds only the slot, never the
+    downloaded body, so each page is yielded as soon as it arrives. The session's connector keeps connections alive
+    and caches DNS, so every page after the first few reuses an open
+    TLS connection instead of paying a fresh handshake.
     
     Args:
-        soup: BeautifulSoup object of the page
+        urls: Page URLs to fetch
+        headers: HTTP headers sent with every request
+        delay: Minimum seconds between request starts on one slot
+        max_concurrency: Maximum number of simultaneous requests
+        max_retries: Retries on connection errors, timeouts and RETRY_STATUSES responses
+        backoff_factor: Base of the exponential backoff between retries, used
+            when the server sends no Retry-After
+    
+    Yields:
+        (index into `urls`, result) pairs in completion order, where the
+        result is a (body bytes, declared charset) tuple or the exception
+        raised while fetching that URL
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    timeout = aiohttp.ClientTimeout(total=10)
+    pending = len(urls)  # Requests not yet started
+    
+    async def _fetch(session: aiohttp.ClientSession, index: int, url: str) -> Tuple[int, object]:
+        nonlocal pending
+        loop = asyncio.get_running_loop()
+        await semaphore.acquire()
+        pending -= 1
+        started = loop.time()
+        try:
+            for attempt in range(max_retries + 1):
+                wait = None
+                try:
+                    async with session.get(url) as response:
+                        if response.status in RETRY_STATUSES and attempt < max_retries:
+                            wait = _retry_after_seconds(response.headers.get('Retry-After'))
+                        else:
+                            response.raise_for_status()
+                            content = await response.read()
+                            charset = response.charset
+                            break
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if attempt == max_retries:
+                        raise
+                if wait is None:
+                    wait = backoff_factor * (2 ** attempt)
+                await asyncio.sleep(min(wait, MAX_RETRY_AFTER))
+        except Exception as e:
+            return index, e
+        else:
+            return index, (content, charset)
+        finally:
+            # Respectful delay between requests: the slot is released `delay`
+            # after this request started, counting the time the request itself
+            # took, and immediately once nothing is queued. Only the slot waits;
+            # the body is handed back as soon as it has been read
+            remaining = started + delay - loop.time() if pending else 0.0
+            if remaining > 0:
+                loop.call_later(remaining, semaphore.release)
+            else:
+                semaphore.release()
+    
+    connector = aiohttp.TCPConnector(
+        limit=max_concurrency,
+        limit_per_host=max_concurrency,
+        ttl_dns_cache=300
+    )
+    async with aiohttp.ClientSession(
+        headers=headers, timeout=timeout, connector=connector
+    ) as session:
+        # No task list is kept, so each body is freed once its page is consumed
+        for next_page in asyncio.as_completed(
+            [_fetch(session, index, url) for index, url in enumerate(urls)]
+        ):
+            yield await next_page
+
+
+def _parse_page(content: bytes, charset: Optional[str], category: str, base_url: str) -> List[Dict]:
+    """
+    Parse a fetched page body and extract its products.
+    
+    Args:
+        content: Raw response body
+        charset: Charset declared by the server, if any
+        category: Category name for the products
+        base_url: Base URL for constructing product URLs
+    
+    Returns:
+        List of product dictionaries
+    """
+    # Parse HTML with the Lexbor C parser, decoding with the
+    # charset the server declared
+    tree = LexborHTMLParser(content.decode(charset or 'utf-8', 'replace'))
+    return _extract_products_from_page(tree, category, base_url)
+
+
+def _extract_products_from_page(tree: LexborHTMLParser, category: str, base_url: str) -> List[Dict]:
+    """
+    Extract individual product data from a parsed page.
+    
+    Each selector query walks the item's whole subtree, so the reviews
+    and URL lookups share a single query over the item's links.
+    
+    Args:
+        tree: Parsed HTML tree of the page
         category: Category name for the products
         base_url: Base URL for constructing product URLs
     
@@ -140,43 +358,50 @@ def _extract_products_from_page(soup: BeautifulSoup, category: str, base_url: st
     
     # Find all product items on the page
     # Amazon uses various selectors; adjust based on actual page structure
-    product_items = soup.find_all('div', {'class': re.compile(r'zg-grid-general-faceout|p13n-sc-uncoverable-faceout')})
+    product_items = tree.css(_PRODUCT_ITEM_SELECTOR)
     
     for idx, item in enumerate(product_items):
         try:
             # Extract product ID (from ASIN or data attribute)
-            asin_elem = item.find('div', {'data-asin': True})
-            product_id = asin_elem.get('data-asin', f'UNKNOWN_{category}_{idx}') if asin_elem else f'UNKNOWN_{category}_{idx}'
+            asin_elem = item.css_first(_ASIN_SELECTOR)
+            # An empty data-asin stays '' (and is dropped by transform_data); only a
+            # missing ASIN element gets a placeholder ID
+            product_id = (asin_elem.attributes.get('data-asin') or '') if asin_elem else f'UNKNOWN_{category}_{idx}'
             
             # Extract product name/title
-            name_elem = item.find('div', {'class': re.compile(r'p13n-sc-truncate|_cDEzb_p13n-sc-css-line-clamp-3')})
+            name_elem = item.css_first(_NAME_SELECTOR)
             if not name_elem:
-                name_elem = item.find('img', {'alt': True})
-                name = name_elem.get('alt', 'Unknown Product').strip() if name_elem else 'Unknown Product'
+                name_elem = item.css_first(_IMAGE_ALT_SELECTOR)
+                name = (name_elem.attributes.get('alt') or '').strip() if name_elem else 'Unknown Product'
             else:
-                name = name_elem.get_text(strip=True)
+                name = name_elem.text(strip=True)
             
             # Extract company/brand (often in title or separate element)
             company = _extract_company_from_name(name)
             
             # Extract description/tags (use truncated title as description)
-            description = name[:200] if len(name) > 200 else name
+            description = name[:200]
             
             # Extract price
-            price_elem = item.find('span', {'class': re.compile(r'p13n-sc-price|a-price-whole')})
-            price_text = price_elem.get_text(strip=True) if price_elem else None
+            price_elem = item.css_first(_PRICE_SELECTOR)
+            price_text = price_elem.text(strip=True) if price_elem else None
+            
+            # Links in document order; the first is the reviews link
+            links = item.css(_LINK_SELECTOR)
             
             # Extract reviews count
-            reviews_elem = item.find('a', {'class': re.compile(r'a-size-small|a-link-normal')})
-            reviews_text = reviews_elem.get_text(strip=True) if reviews_elem else '0'
+            reviews_text = links[0].text(strip=True) if links else '0'
             
             # Extract rating
-            rating_elem = item.find('span', {'class': re.compile(r'a-icon-alt')})
-            rating_text = rating_elem.get_text(strip=True) if rating_elem else None
+            rating_elem = item.css_first(_RATING_SELECTOR)
+            rating_text = rating_elem.text(strip=True) if rating_elem else None
             
             # Extract product URL
-            url_elem = item.find('a', {'class': re.compile(r'a-link-normal')})
-            product_url = url_elem.get('href', '') if url_elem else ''
+            url_elem = next(
+                (link for link in links if 'a-link-normal' in (link.attributes.get('class') or '')),
+                None
+            )
+            product_url = (url_elem.attributes.get('href') or '') if url_elem else ''
             if product_url and not product_url.startswith('http'):
                 product_url = f"https://www.amazon.com{product_url}"
             
@@ -202,11 +427,13 @@ def _extract_products_from_page(soup: BeautifulSoup, category: str, base_url: st
     return products
 
 
+@lru_cache(maxsize=4096)
 def _extract_company_from_name(name: str) -> str:
     """
     Extract company/brand name from product title.
     
-    Many product titles start with brand name.
+    Many product titles start with brand name. Results are cached since
+    the same titles recur across pages and repeated runs.
     
     Args:
         name: Product name/title
@@ -225,6 +452,39 @@ def _extract_company_from_name(name: str) -> str:
     return company
 
 
+def _read_raw_cache(path: str) -> List[Dict]:
+    """
+    Read raw product dictionaries saved by _write_raw_cache.
+    
+    Args:
+        path: Cache file path
+    
+    Returns:
+        List of raw product dictionaries
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _write_raw_cache(path: str, raw_products: List[Dict]) -> None:
+    """
+    Save raw product dictionaries so later runs can skip extraction.
+    
+    Uses orjson when installed and falls back to the standard library.
+    
+    Args:
+        path: Cache file path
+        raw_products: List of raw product dictionaries
+    """
+    if orjson:
+        data = orjson.dumps(raw_products)
+    else:
+        data = json.dumps(raw_products, ensure_ascii=False).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
 # ================================================================
 # TRANSFORM FUNCTIONS
 # ================================================================
@@ -250,26 +510,42 @@ def transform_data(raw_products: List[Dict]) -> List[Product]:
     
     cleaned_products = []
     
+    # Category and company take only a handful of distinct values per
+    # batch, so each distinct value is cleaned once and then looked up
+    clean_categories = {}
+    clean_companies = {}
+    
     for raw in raw_products:
         try:
-            # Clean and validate product data
-            product = Product(
-                product_id=_clean_text(raw.get('product_id', '')),
-                name=_clean_text(raw.get('name', 'Unknown')),
-                category=_clean_text(raw.get('category', 'Uncategorized')),
-                company=_clean_text(raw.get('company', 'Unknown')),
+            # Validate required fields before doing any parsing work
+            product_id = _clean_text(raw.get('product_id', ''))
+            name = _clean_text(raw.get('name', 'Unknown'))
+            url = _clean_text(raw.get('url', ''))
+            
+            if not (product_id and name and url):
+                logger.warning(f"Skipping invalid product: {raw.get('product_id', 'NO_ID')}")
+                continue
+            
+            category = raw.get('category', 'Uncategorized')
+            if category not in clean_categories:
+                clean_categories[category] = _clean_text(category)
+            
+            company = raw.get('company', 'Unknown')
+            if company not in clean_companies:
+                clean_companies[company] = _clean_text(company)
+            
+            # Clean product data
+            cleaned_products.append(Product(
+                product_id=product_id,
+                name=name,
+                category=clean_categories[category],
+                company=clean_companies[company],
                 description=_clean_text(raw.get('description', '')),
                 price=_parse_price(raw.get('price')),
-                url=_clean_text(raw.get('url', '')),
+                url=url,
                 reviews_count=_parse_reviews_count(raw.get('reviews_count')),
                 avg_rating=_parse_rating(raw.get('avg_rating')),
-            )
-            
-            # Validate required fields
-            if product.product_id and product.name and product.url:
-                cleaned_products.append(product)
-            else:
-                logger.warning(f"Skipping invalid product: {raw.get('product_id', 'NO_ID')}")
+            ))
                 
         except Exception as e:
             logger.error(f"Error transforming product {raw.get('product_id', 'UNKNOWN')}: {e}")
@@ -296,7 +572,7 @@ def _clean_text(text: Optional[str]) -> str:
     cleaned = text.strip()
     
     # Remove extra spaces
-    cleaned = re.sub(r'\s+', ' ', cleaned)
+    cleaned = _WHITESPACE_RE.sub(' ', cleaned)
     
     return cleaned
 
@@ -322,23 +598,25 @@ def _parse_price(price_text: Optional[str]) -> Optional[float]:
     
     try:
         # Remove currency symbols and commas
-        cleaned = re.sub(r'[$,€£]', '', price_text)
+        cleaned = price_text.translate(_CURRENCY_TABLE)
         
         # Check for price range (e.g., "50-100")
-        if '-' in cleaned:
-            parts = cleaned.split('-')
-            if len(parts) == 2:
+        if cleaned.count('-') == 1:
+            low_text, _, high_text = cleaned.partition('-')
+            low_match = _NUMBER_RE.search(low_text)
+            high_match = _NUMBER_RE.search(high_text)
+            if low_match and high_match:
                 try:
-                    low = float(re.findall(r'[\d.]+', parts[0])[0])
-                    high = float(re.findall(r'[\d.]+', parts[1])[0])
+                    low = float(low_match.group())
+                    high = float(high_match.group())
                     return round((low + high) / 2, 2)
-                except (IndexError, ValueError):
+                except ValueError:
                     pass
         
         # Extract first numeric value
-        matches = re.findall(r'[\d.]+', cleaned)
-        if matches:
-            price = float(matches[0])
+        match = _NUMBER_RE.search(cleaned)
+        if match:
+            price = float(match.group())
             # Validate reasonable price range
             if 0 < price < 1000000:
                 return round(price, 2)
@@ -371,20 +649,25 @@ def _parse_reviews_count(reviews_text: Optional[str]) -> int:
         # Remove commas
         cleaned = reviews_text.replace(',', '')
         
-        # Handle K/M notation
-        if 'k' in cleaned.lower():
-            num = float(re.findall(r'[\d.]+', cleaned)[0])
-            return int(num * 1000)
-        elif 'm' in cleaned.lower():
-            num = float(re.findall(r'[\d.]+', cleaned)[0])
-            return int(num * 1000000)
+        # Handle K/M notation (lower-cased once for both checks)
+        lowered = cleaned.lower()
+        if 'k' in lowered:
+            multiplier = 1000
+        elif 'm' in lowered:
+            multiplier = 1000000
+        else:
+            multiplier = None
+        
+        if multiplier:
+            match = _NUMBER_RE.search(cleaned)
+            return int(float(match.group()) * multiplier) if match else 0
         
         # Extract numeric value
-        matches = re.findall(r'\d+', cleaned)
-        if matches:
-            return int(matches[0])
+        match = _INTEGER_RE.search(cleaned)
+        if match:
+            return int(match.group())
     
-    except (ValueError, IndexError) as e:
+    except ValueError as e:
         logger.debug(f"Could not parse reviews count '{reviews_text}': {e}")
     
     return 0
@@ -410,9 +693,9 @@ def _parse_rating(rating_text: Optional[str]) -> Optional[float]:
     
     try:
         # Extract first numeric value
-        matches = re.findall(r'[\d.]+', rating_text)
-        if matches:
-            rating = float(matches[0])
+        match = _NUMBER_RE.search(rating_text)
+        if match:
+            rating = float(match.group())
             # Validate rating range
             if 0 <= rating <= 5:
                 return round(rating, 2)
@@ -461,6 +744,13 @@ def load_to_database(
     cursor = None
     
     try:
+        # LOAD DATA LOCAL INFILE is only enabled when the batch is large
+        # enough for _load_products to take the bulk-load path, and then only
+        # for files in the temp directory
+        bulk_load_options = {}
+        if len(products) >= BULK_LOAD_THRESHOLD:
+            bulk_load_options['allow_local_infile_in_path'] = tempfile.gettempdir()
+        
         # Establish database connection
         connection = mysql.connector.connect(
             host=host,
@@ -468,15 +758,19 @@ def load_to_database(
             user=user,
             password=password,
             charset='utf8mb4',
-            collation='utf8mb4_unicode_ci'
+            collation='utf8mb4_unicode_ci',
+            use_pure=False,       # C extension: faster protocol encoding
+            autocommit=False,     # Whole load runs in one transaction
+            buffered=True,
+            consume_results=True,
+            **bulk_load_options
         )
         
         if connection.is_connected():
-            cursor = connection.cursor(dictionary=True)
+            cursor = connection.cursor()
             logger.info(f"Connected to MySQL database: {database}")
             
-            # Insert data in transaction
-            connection.start_transaction()
+            # Insert data in one transaction (implicit, since autocommit is off)
             
             # Load categories and companies (get ID mappings)
             category_map = _load_categories(cursor, products)
@@ -507,6 +801,23 @@ def load_to_database(
             logger.info("Database connection closed")
 
 
+def _executemany_batched(cursor, query: str, rows: List[Tuple]) -> None:
+    """
+    Run executemany in INSERT_BATCH_SIZE chunks.
+    
+    mysql-connector rewrites each executemany call on an INSERT ... VALUES
+    statement into one multi-row INSERT, so every chunk is a single
+    round-trip of bounded size.
+    
+    Args:
+        cursor: MySQL cursor object
+        query: Parameterized INSERT statement
+        rows: Parameter tuples
+    """
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        cursor.executemany(query, rows[start:start + INSERT_BATCH_SIZE])
+
+
 def _load_categories(cursor, products: List[Product]) -> Dict[str, int]:
     """
     Insert unique categories and return category_name -> category_id mapping.
@@ -523,34 +834,36 @@ def _load_categories(cursor, products: List[Product]) -> Dict[str, int]:
     # Get unique categories
     unique_categories = {p.category for p in products if p.category}
     
-    category_map = {}
+    if not unique_categories:
+        return {}
     
-    # Insert categories using parameterized query
+    # Sorted so concurrent loaders take row locks in the same order
+    category_names = sorted(unique_categories)
+    
+    # Insert all categories in one batch; existing rows are left untouched
     insert_query = """
         INSERT INTO categories (category_name)
         VALUES (%s)
-        ON DUPLICATE KEY UPDATE category_id=LAST_INSERT_ID(category_id)
+        ON DUPLICATE KEY UPDATE category_id = category_id
     """
     
-    for category_name in unique_categories:
-        try:
-            cursor.execute(insert_query, (category_name,))
-            category_id = cursor.lastrowid
-            
-            # If category already existed, get its ID
-            if category_id == 0:
-                cursor.execute(
-                    "SELECT category_id FROM categories WHERE category_name = %s",
-                    (category_name,)
-                )
-                result = cursor.fetchone()
-                if result:
-                    category_id = result['category_id']
-            
-            category_map[category_name] = category_id
-            
-        except Error as e:
-            logger.error(f"Error inserting category '{category_name}': {e}")
+    # Fetch every ID in one round-trip. Joining against the names we sent
+    # (rather than filtering with IN) keys the result by our own spelling
+    # even when the case-insensitive collation matched a stored variant.
+    names_table = " UNION ALL ".join(["SELECT %s AS category_name"] * len(category_names))
+    select_query = f"""
+        SELECT n.category_name, c.category_id
+        FROM ({names_table}) n
+        JOIN categories c ON c.category_name = n.category_name
+    """
+    
+    try:
+        cursor.executemany(insert_query, [(name,) for name in category_names])
+        cursor.execute(select_query, category_names)
+        category_map = dict(cursor.fetchall())
+    except Error as e:
+        logger.error(f"Error loading categories: {e}")
+        raise
     
     logger.info(f"Loaded {len(category_map)} categories")
     return category_map
@@ -572,35 +885,35 @@ def _load_companies(cursor, products: List[Product]) -> Dict[str, int]:
     # Get unique companies
     unique_companies = {p.company for p in products if p.company}
     
-    company_map = {}
+    if not unique_companies:
+        return {}
     
-    # Insert companies using parameterized query
+    # Sorted so concurrent loaders take row locks in the same order
+    company_names = sorted(unique_companies)
+    
+    # Insert all companies in one batch; existing rows are left untouched
+    # For now, company_industry is NULL (could be enhanced)
     insert_query = """
         INSERT INTO companies (company_name, company_industry)
         VALUES (%s, %s)
-        ON DUPLICATE KEY UPDATE company_id=LAST_INSERT_ID(company_id)
+        ON DUPLICATE KEY UPDATE company_id = company_id
     """
     
-    for company_name in unique_companies:
-        try:
-            # For now, company_industry is NULL (could be enhanced)
-            cursor.execute(insert_query, (company_name, None))
-            company_id = cursor.lastrowid
-            
-            # If company already existed, get its ID
-            if company_id == 0:
-                cursor.execute(
-                    "SELECT company_id FROM companies WHERE company_name = %s",
-                    (company_name,)
-                )
-                result = cursor.fetchone()
-                if result:
-                    company_id = result['company_id']
-            
-            company_map[company_name] = company_id
-            
-        except Error as e:
-            logger.error(f"Error inserting company '{company_name}': {e}")
+    # Fetch every ID in one round-trip, keyed by the names we sent
+    names_table = " UNION ALL ".join(["SELECT %s AS company_name"] * len(company_names))
+    select_query = f"""
+        SELECT n.company_name, c.company_id
+        FROM ({names_table}) n
+        JOIN companies c ON c.company_name = n.company_name
+    """
+    
+    try:
+        cursor.executemany(insert_query, [(name, None) for name in company_names])
+        cursor.execute(select_query, company_names)
+        company_map = dict(cursor.fetchall())
+    except Error as e:
+        logger.error(f"Error loading companies: {e}")
+        raise
     
     logger.info(f"Loaded {len(company_map)} companies")
     return company_map
@@ -640,33 +953,105 @@ def _load_products(
             updated_at = CURRENT_TIMESTAMP
     """
     
-    inserted_count = 0
+    # One parameter tuple per product, sent as multi-row INSERT batches
+    rows = [
+        (
+            product.product_id,
+            product.name,
+            category_map.get(product.category),
+            company_map.get(product.company),
+            product.description,
+            product.price,
+            product.url
+        )
+        for product in products
+    ]
     
-    for product in products:
+    if len(rows) >= BULK_LOAD_THRESHOLD:
         try:
-            # Get foreign key IDs
-            category_id = category_map.get(product.category)
-            company_id = company_map.get(product.company)
-            
-            # Execute parameterized query
-            cursor.execute(insert_query, (
-                product.product_id,
-                product.name,
-                category_id,
-                company_id,
-                product.description,
-                product.price,
-                product.url
-            ))
-            
-            inserted_count += 1
-            
+            _bulk_load_products(cursor, rows)
+            logger.info(f"Loaded {len(rows)} products via LOAD DATA")
+            return
         except Error as e:
-            logger.error(f"Error inserting product '{product.product_id}': {e}")
+            # e.g. local_infile disabled on the server; fall back to INSERT
+            logger.warning(f"Bulk load unavailable, using batched INSERT: {e}")
+    
+    try:
+        _executemany_batched(cursor, insert_query, rows)
+    except Error as e:
+        logger.error(f"Error inserting products: {e}")
+        raise
+    
+    inserted_count = len(rows)
     
     logger.info(f"Loaded {inserted_count} products")
 
 
+def _bulk_load_products(cursor, rows: List[Tuple]) -> None:
+    """
+    Upsert product rows via LOAD DATA LOCAL INFILE and a staging table.
+    
+    The rows are written to a temporary TSV file, streamed into a
+    TEMPORARY staging table, then merged into products with a single
+    INSERT ... SELECT that keeps the ON DUPLICATE KEY UPDATE semantics.
+    
+    Args:
+        cursor: MySQL cursor object
+        rows: Product parameter tuples in products column order
+    """
+    with tempfile.NamedTemporaryFile(
+        'w', encoding='utf-8', newline='', suffix='.tsv', delete=False
+    ) as f:
+        f.writelines(
+            '\t'.join(
+                '\\N' if value is None else str(value).translate(_TSV_ESCAPES)
+                for value in row
+            ) + '\n'
+            for row in rows
+        )
+        path = f.name
+    
+    try:
+        cursor.execute("DROP TEMPORARY TABLE IF EXISTS products_stage")
+        cursor.execute("""
+            CREATE TEMPORARY TABLE products_stage (
+                product_id VARCHAR(100) NOT NULL,
+                name VARCHAR(500) NOT NULL,
+                category_id INT,
+                company_id INT,
+                description TEXT,
+                price DECIMAL(10, 2),
+                url VARCHAR(1000) NOT NULL
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """)
+        cursor.execute("""
+            LOAD DATA LOCAL INFILE %s
+            INTO TABLE products_stage
+            CHARACTER SET utf8mb4
+            (product_id, name, category_id, company_id, description, price, url)
+        """, (path,))
+        cursor.execute("""
+            INSERT INTO products (
+                product_id, name, category_id, company_id,
+                description, price, url
+            )
+            SELECT product_id, name, category_id, company_id,
+                   description, price, url
+            FROM products_stage
+            ON DUPLICATE KEY UPDATE
+                name = VALUES(name),
+                category_id = VALUES(category_id),
+                company_id = VALUES(company_id),
+                description = VALUES(description),
+                price = VALUES(price),
+                url = VALUES(url),
+                updated_at = CURRENT_TIMESTAMP
+        """)
+        cursor.execute("DROP TEMPORARY TABLE products_stage")
+    finally:
+        os.remove(path)
+
+
 def _load_product_metrics(cursor, products: List[Product]) -> None:
     """
     Insert product metrics (reviews, ratings) into database.
@@ -693,30 +1078,28 @@ def _load_product_metrics(cursor, products: List[Product]) -> None:
             is_featured = VALUES(is_featured)
     """
     
-    inserted_count = 0
+    # One parameter tuple per product; a product is featured when it has
+    # a high rating and enough reviews
+    rows = [
+        (
+            product.product_id,
+            product.reviews_count,
+            product.avg_rating,
+            product.avg_rating is not None and
+            product.avg_rating >= 4.5 and
+            product.reviews_count >= 100,
+            snapshot_date
+        )
+        for product in products
+    ]
+    
+    try:
+        _executemany_batched(cursor, insert_query, rows)
+    except Error as e:
+        logger.error(f"Error inserting product metrics: {e}")
+        raise
     
-    for product in products:
-        try:
-            # Determine if product is featured (has high rating and reviews)
-            is_featured = (
-                product.avg_rating is not None and
-                product.avg_rating >= 4.5 and
-                product.reviews_count >= 100
-            )
-            
-            # Execute parameterized query
-            cursor.execute(insert_query, (
-                product.product_id,
-                product.reviews_count,
-                product.avg_rating,
-                is_featured,
-                snapshot_date
-            ))
-            
-            inserted_count += 1
-            
-        except Error as e:
-            logger.error(f"Error inserting metrics for '{product.product_id}': {e}")
+    inserted_count = len(rows)
     
     logger.info(f"Loaded {inserted_count} product metrics")
 
@@ -727,7 +1110,9 @@ def _load_product_metrics(cursor, products: List[Product]) -> None:
 
 def run_etl_pipeline(
     num_pages: int = 5,
-    db_config: Optional[Dict] = None
+    db_config: Optional[Dict] = None,
+    raw_cache: Optional[str] = None,
+    refresh_cache: bool = False
 ) -> None:
     """
     Run the complete ETL pipeline.
@@ -740,6 +1125,10 @@ def run_etl_pipeline(
     Args:
         num_pages: Number of pages to scrape per category
         db_config: Database configuration dictionary
+        raw_cache: Optional path of a raw-product cache file. When it exists
+            extraction is skipped and its contents are used instead; when it
+            does not, freshly extracted products are written to it.
+        refresh_cache: Re-extract and overwrite the cache even if it exists
     """
     logger.info("=" * 60)
     logger.info("STARTING ETL PIPELINE")
@@ -749,7 +1138,14 @@ def run_etl_pipeline(
     
     try:
         # STEP 1: EXTRACT
-        raw_products = extract_products(num_pages=num_pages)
+        if raw_cache and not refresh_cache and os.path.exists(raw_cache):
+            raw_products = _read_raw_cache(raw_cache)
+            logger.info(f"Loaded {len(raw_products)} raw products from cache: {raw_cache}")
+        else:
+            raw_products = extract_products(num_pages=num_pages)
+            if raw_cache and raw_products:
+                _write_raw_cache(raw_cache, raw_products)
+                logger.info(f"Saved raw products to cache: {raw_cache}")
         
         if not raw_products:
             logger.error("No products extracted. Aborting pipeline.")
@@ -14,6 +14,9 @@ This script will:
 4. Verify the setup
 """
 
+import re
+from itertools import groupby
+from operator import itemgetter
 import mysql.connector
 from mysql.connector import Error
 import sys
@@ -26,6 +29,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Whole-line SQL comments. These must be stripped before the multi-statement
+# execute: the commented-out sample queries at the end of schema.sql contain
+# ";", and the connector splits the batch on every ";" it sees, comment or not
+SQL_COMMENT_LINE = re.compile(r'^\s*--.*$', re.MULTILINE)
+
 
 def read_sql_file(filename: str) -> str:
     """Read SQL commands from file."""
@@ -77,32 +85,34 @@ def setup_database(host='localhost', user='root', password='', database='ecommer
             logger.info("Creating tables from schema.sql...")
             schema_sql = read_sql_file('schema.sql')
             
-            # Split SQL commands (simple split by semicolon)
-            commands = [cmd.strip() for cmd in schema_sql.split(';') if cmd.strip()]
-            
-            # Execute each command
-            for command in commands:
-                # Skip comments and empty commands
-                if command.startswith('--') or not command:
-                    continue
-                
-                try:
-                    cursor.execute(command)
-                    logger.debug(f"Executed: {command[:50]}...")
-                except Error as e:
-                    # Log error but continue (for DROP IF EXISTS, etc.)
-                    logger.debug(f"Command error (may be expected): {e}")
+            # Strip comment lines, then send the whole schema as one
+            # multi-statement batch (a single round-trip)
+            schema_sql = SQL_COMMENT_LINE.sub('', schema_sql)
+            for result in cursor.execute(schema_sql, multi=True):
+                logger.debug(f"Executed: {result.statement[:50]}...")
             
             connection.commit()
             logger.info("All tables created successfully")
             
-            # Verify tables were created
+            # Verify tables were created, fetching every column of the
+            # expected tables in one information_schema query
             logger.info("Verifying table creation...")
-            cursor.execute("SHOW TABLES")
-            tables = cursor.fetchall()
-            
             expected_tables = {'categories', 'companies', 'products', 'product_metrics'}
-            created_tables = {table[0] for table in tables}
+            cursor.execute(
+                """
+                SELECT table_name, column_name, column_type, is_nullable
+                FROM information_schema.columns
+                WHERE table_schema = %s AND table_name IN (%s, %s, %s, %s)
+                ORDER BY table_name, ordinal_position
+                """,
+                (database, *sorted(expected_tables))
+            )
+            
+            table_columns = {
+                table: [(col[1], col[2], col[3]) for col in columns]
+                for table, columns in groupby(cursor.fetchall(), key=itemgetter(0))
+            }
+            created_tables = set(table_columns)
             
             if expected_tables.issubset(created_tables):
                 logger.info("✓ All required tables created successfully:")
@@ -116,8 +126,7 @@ def setup_database(host='localhost', user='root', password='', database='ecommer
             # Display table information
             logger.info("\nDatabase schema summary:")
             for table in expected_tables:
-                cursor.execute(f"DESCRIBE {table}")
-                columns = cursor.fetchall()
+                columns = table_columns[table]
                 logger.info(f"\n{table} ({len(columns)} columns):")
                 for col in columns:
                     logger.info(f"  {col[0]:20} {col[1]:20} {col[2]:10}")
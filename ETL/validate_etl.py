@@ -5,7 +5,7 @@ ETL Pipeline Validation Script
 Validates the data loaded by the ETL pipeline and generates a summary report.
 
 Usage:
-    python validate_etl.py
+    python validate_etl.py [--cache [DIR]]
 
 This script will:
 1. Connect to the database
@@ -16,10 +16,18 @@ This script will:
 
 import mysql.connector
 from mysql.connector import Error
+import argparse
+import hashlib
+import io
+import json
+import os
 import sys
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -28,13 +36,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Independent validation steps run concurrently by run_validation, each on its
+# own connection (MySQL connections are not thread-safe)
+VALIDATION_STEPS = (
+    'validate_table_counts',
+    'validate_data_quality',
+    'generate_statistics',
+)
+
+# With --cache, validation results are stored per data fingerprint so re-running
+# against unchanged tables skips the queries; entries older than the TTL are ignored
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'etlval')
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Report statuses in increasing severity
+STATUS_LEVELS = ("PASS", "WARNING", "FAIL")
+PASS, WARNING, FAIL = range(3)
+
+# Data-quality report rows: (check key, label, severity when the count is non-zero)
+QUALITY_CHECK_ROWS = (
+    ('products_without_price', "Products without price:", WARNING),
+    ('products_without_rating', "Products without rating:", WARNING),
+    ('duplicate_products', "Duplicate product IDs:", FAIL),
+    ('orphaned_metrics', "Orphaned metrics:", FAIL),
+)
+
+
+def _json_default(value):
+    """Encode the Decimal values MySQL returns for DECIMAL and aggregate columns."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 
 class ETLValidator:
     """Validator class for ETL pipeline results."""
     
-    def __init__(self, db_config: Dict):
-        """Initialize validator with database configuration."""
+    def __init__(self, db_config: Dict, cache_dir: Optional[str] = None):
+        """
+        Initialize validator with database configuration.
+        
+        Args:
+            db_config: MySQL connection parameters
+            cache_dir: Optional directory for cached validation results;
+                caching is disabled when None
+        """
         self.db_config = db_config
+        self.cache_dir = cache_dir
         self.connection = None
         self.cursor = None
         self.validation_results = {}
@@ -42,11 +90,12 @@ class ETLValidator:
     def connect(self):
         """Establish database connection."""
         try:
+            # connect() raises on failure, so a returned connection is already open
+            # and an is_connected() ping would only cost a round-trip
             self.connection = mysql.connector.connect(**self.db_config)
-            if self.connection.is_connected():
-                self.cursor = self.connection.cursor(dictionary=True)
-                logger.info("Connected to database successfully")
-                return True
+            self.cursor = self.connection.cursor(dictionary=True)
+            logger.info("Connected to database successfully")
+            return True
         except Error as e:
             logger.error(f"Database connection failed: {e}")
             return False
@@ -58,28 +107,29 @@ class ETLValidator:
         if self.connection and self.connection.is_connected():
             self.connection.close()
             logger.info("Database connection closed")
+        self.cursor = None
+        self.connection = None
     
     def validate_table_counts(self) -> Dict:
         """Validate that tables have data."""
         logger.info("Validating table record counts...")
         
         tables = ['categories', 'companies', 'products', 'product_metrics']
-        counts = {}
+        counts = dict.fromkeys(tables, 0)
         
-        for table in tables:
-            try:
-                self.cursor.execute(f"SELECT COUNT(*) as count FROM {table}")
-                result = self.cursor.fetchone()
-                count = result['count']
-                counts[table] = count
-                
-                status = "✓" if count > 0 else "✗"
-                logger.info(f"{status} {table}: {count:,} records")
-                
-            except Error as e:
-                logger.error(f"Error counting {table}: {e}")
-                counts[table] = 0
+        # One round-trip for all four counts
+        count_sql = " UNION ALL ".join(
+            f"SELECT '{table}' AS table_name, COUNT(*) AS count FROM {table}" for table in tables
+        )
+        try:
+            self.cursor.execute(count_sql)
+            for row in self.cursor.fetchall():
+                counts[row['table_name']] = row['count']
+        except Error as e:
+            logger.error(f"Error counting tables: {e}")
+            self._record_failure('table_counts')
         
+        self._log_table_counts(counts)
         self.validation_results['table_counts'] = counts
         return counts
     
@@ -89,66 +139,29 @@ class ETLValidator:
         
         quality_checks = {}
         
-        # Check 1: Products without prices
+        # All four checks as scalar subqueries, fetched in one round-trip
         try:
             self.cursor.execute("""
-                SELECT COUNT(*) as count 
-                FROM products 
-                WHERE price IS NULL OR price = 0
+                SELECT
+                    (SELECT COUNT(*) FROM products
+                     WHERE price IS NULL OR price = 0) AS products_without_price,
+                    (SELECT COUNT(*) FROM product_metrics
+                     WHERE avg_rating IS NULL) AS products_without_rating,
+                    (SELECT COUNT(*) FROM (
+                        SELECT product_id FROM products
+                        GROUP BY product_id
+                        HAVING COUNT(*) > 1
+                     ) d) AS duplicate_products,
+                    (SELECT COUNT(*) FROM product_metrics pm
+                     LEFT JOIN products p ON pm.product_id = p.product_id
+                     WHERE p.id IS NULL) AS orphaned_metrics
             """)
-            no_price = self.cursor.fetchone()['count']
-            quality_checks['products_without_price'] = no_price
-            logger.info(f"Products without price: {no_price:,}")
+            quality_checks.update(self.cursor.fetchone())
         except Error as e:
-            logger.error(f"Error checking prices: {e}")
-        
-        # Check 2: Products without ratings
-        try:
-            self.cursor.execute("""
-                SELECT COUNT(*) as count 
-                FROM product_metrics 
-                WHERE avg_rating IS NULL
-            """)
-            no_rating = self.cursor.fetchone()['count']
-            quality_checks['products_without_rating'] = no_rating
-            logger.info(f"Products without rating: {no_rating:,}")
-        except Error as e:
-            logger.error(f"Error checking ratings: {e}")
-        
-        # Check 3: Duplicate product IDs
-        try:
-            self.cursor.execute("""
-                SELECT product_id, COUNT(*) as count 
-                FROM products 
-                GROUP BY product_id 
-                HAVING count > 1
-            """)
-            duplicates = self.cursor.fetchall()
-            quality_checks['duplicate_products'] = len(duplicates)
-            if duplicates:
-                logger.warning(f"Found {len(duplicates)} duplicate product IDs!")
-            else:
-                logger.info(f"✓ No duplicate product IDs")
-        except Error as e:
-            logger.error(f"Error checking duplicates: {e}")
-        
-        # Check 4: Orphaned metrics (metrics without products)
-        try:
-            self.cursor.execute("""
-                SELECT COUNT(*) as count 
-                FROM product_metrics pm
-                LEFT JOIN products p ON pm.product_id = p.product_id
-                WHERE p.id IS NULL
-            """)
-            orphaned = self.cursor.fetchone()['count']
-            quality_checks['orphaned_metrics'] = orphaned
-            if orphaned > 0:
-                logger.warning(f"Found {orphaned} orphaned metrics!")
-            else:
-                logger.info(f"✓ No orphaned metrics")
-        except Error as e:
-            logger.error(f"Error checking orphaned metrics: {e}")
+            logger.error(f"Error checking data quality: {e}")
+            self._record_failure('quality_checks')
         
+        self._log_quality_checks(quality_checks)
         self.validation_results['quality_checks'] = quality_checks
         return quality_checks
     
@@ -158,9 +171,10 @@ class ETLValidator:
         
         stats = {}
         
-        # Average price per category
+        # Category, top-product and company statistics go to the server as one
+        # multi-statement batch; each result set is read in order
         try:
-            self.cursor.execute("""
+            results = self.cursor.execute("""
                 SELECT 
                     c.category_name,
                     COUNT(p.id) as product_count,
@@ -171,31 +185,15 @@ class ETLValidator:
                 JOIN products p ON c.category_id = p.category_id
                 WHERE p.price IS NOT NULL AND p.price > 0
                 GROUP BY c.category_id, c.category_name
-                ORDER BY product_count DESC
-            """)
-            category_stats = self.cursor.fetchall()
-            stats['category_statistics'] = category_stats
-            
-            logger.info("\nCategory Statistics:")
-            logger.info(f"{'Category':<20} {'Products':<10} {'Avg Price':<12} {'Min Price':<12} {'Max Price':<12}")
-            logger.info("-" * 66)
-            for row in category_stats:
-                logger.info(
-                    f"{row['category_name']:<20} "
-                    f"{row['product_count']:<10} "
-                    f"${row['avg_price']:>10.2f} "
-                    f"${row['min_price']:>10.2f} "
-                    f"${row['max_price']:>10.2f}"
-                )
-        except Error as e:
-            logger.error(f"Error generating category stats: {e}")
-        
-        # Top rated products
-        try:
-            self.cursor.execute("""
+                ORDER BY product_count DESC;
+                
                 SELECT 
                     p.name,
                     c.company_name,
+                    CASE WHEN CHAR_LENGTH(p.name) > 40
+                        THEN CONCAT(LEFT(p.name, 37), '...') ELSE p.name END AS name_short,
+                    CASE WHEN CHAR_LENGTH(c.company_name) > 20
+                        THEN CONCAT(LEFT(c.company_name, 17), '...') ELSE c.company_name END AS company_name_short,
                     cat.category_name,
                     p.price,
                     pm.avg_rating,
@@ -206,31 +204,12 @@ class ETLValidator:
                 JOIN product_metrics pm ON p.product_id = pm.product_id
                 WHERE pm.avg_rating IS NOT NULL
                 ORDER BY pm.avg_rating DESC, pm.reviews_count DESC
-                LIMIT 10
-            """)
-            top_products = self.cursor.fetchall()
-            stats['top_rated_products'] = top_products
-            
-            logger.info("\nTop 10 Rated Products:")
-            logger.info(f"{'Product':<40} {'Company':<20} {'Rating':<8} {'Reviews':<10}")
-            logger.info("-" * 78)
-            for row in top_products:
-                product_name = row['name'][:37] + '...' if len(row['name']) > 40 else row['name']
-                company_name = row['company_name'][:17] + '...' if len(row['company_name']) > 20 else row['company_name']
-                logger.info(
-                    f"{product_name:<40} "
-                    f"{company_name:<20} "
-                    f"{row['avg_rating']:<8.2f} "
-                    f"{row['reviews_count']:<10}"
-                )
-        except Error as e:
-            logger.error(f"Error fetching top products: {e}")
-        
-        # Company statistics
-        try:
-            self.cursor.execute("""
+                LIMIT 10;
+                
                 SELECT 
                     c.company_name,
+                    CASE WHEN CHAR_LENGTH(c.company_name) > 30
+                        THEN CONCAT(LEFT(c.company_name, 27), '...') ELSE c.company_name END AS company_name_short,
                     COUNT(p.id) as product_count,
                     AVG(pm.avg_rating) as avg_rating,
                     SUM(pm.reviews_count) as total_reviews
@@ -241,114 +220,311 @@ class ETLValidator:
                 HAVING product_count >= 3
                 ORDER BY avg_rating DESC
                 LIMIT 10
-            """)
-            company_stats = self.cursor.fetchall()
-            stats['top_companies'] = company_stats
-            
-            logger.info("\nTop 10 Companies (with 3+ products):")
-            logger.info(f"{'Company':<30} {'Products':<10} {'Avg Rating':<12} {'Total Reviews':<15}")
-            logger.info("-" * 67)
-            for row in company_stats:
-                company_name = row['company_name'][:27] + '...' if len(row['company_name']) > 30 else row['company_name']
-                avg_rating = row['avg_rating'] if row['avg_rating'] else 0.0
-                logger.info(
-                    f"{company_name:<30} "
-                    f"{row['product_count']:<10} "
-                    f"{avg_rating:<12.2f} "
-                    f"{row['total_reviews']:<15}"
-                )
+            """, multi=True)
+            for result, key in zip(results, ('category_statistics', 'top_rated_products', 'top_companies')):
+                stats[key] = result.fetchall()
         except Error as e:
-            logger.error(f"Error generating company stats: {e}")
+            logger.error(f"Error generating statistics: {e}")
+            self._record_failure('statistics')
         
+        self._log_statistics(stats)
         self.validation_results['statistics'] = stats
         return stats
     
+    def _record_failure(self, check: str):
+        """Note a check whose query failed, so its results are not cached."""
+        self.validation_results.setdefault('failed_checks', []).append(check)
+    
+    def _log_table_counts(self, counts: Dict):
+        """Log the per-table record counts."""
+        for table, count in counts.items():
+            status = "✓" if count > 0 else "✗"
+            logger.info(f"{status} {table}: {count:,} records")
+    
+    def _log_quality_checks(self, quality_checks: Dict):
+        """Log the data-quality check results."""
+        if not quality_checks:
+            return
+        
+        logger.info(f"Products without price: {quality_checks['products_without_price']:,}")
+        logger.info(f"Products without rating: {quality_checks['products_without_rating']:,}")
+        
+        duplicates = quality_checks['duplicate_products']
+        if duplicates > 0:
+            logger.warning(f"Found {duplicates} duplicate product IDs!")
+        else:
+            logger.info(f"✓ No duplicate product IDs")
+        
+        orphaned = quality_checks['orphaned_metrics']
+        if orphaned > 0:
+            logger.warning(f"Found {orphaned} orphaned metrics!")
+        else:
+            logger.info(f"✓ No orphaned metrics")
+    
+    def _log_statistics(self, stats: Dict):
+        """Log the statistics tables, each as a single log record."""
+        if 'category_statistics' in stats:
+            lines = [
+                "\nCategory Statistics:",
+                f"{'Category':<20} {'Products':<10} {'Avg Price':<12} {'Min Price':<12} {'Max Price':<12}",
+                "-" * 66,
+            ]
+            lines.extend(
+                f"{row['category_name']:<20} "
+                f"{row['product_count']:<10} "
+                f"${row['avg_price']:>10.2f} "
+                f"${row['min_price']:>10.2f} "
+                f"${row['max_price']:>10.2f}"
+                for row in stats['category_statistics']
+            )
+            logger.info("\n".join(lines))
+        
+        if 'top_rated_products' in stats:
+            lines = [
+                "\nTop 10 Rated Products:",
+                f"{'Product':<40} {'Company':<20} {'Rating':<8} {'Reviews':<10}",
+                "-" * 78,
+            ]
+            lines.extend(
+                f"{row['name_short']:<40} "
+                f"{row['company_name_short']:<20} "
+                f"{row['avg_rating']:<8.2f} "
+                f"{row['reviews_count']:<10}"
+                for row in stats['top_rated_products']
+            )
+            logger.info("\n".join(lines))
+        
+        if 'top_companies' in stats:
+            lines = [
+                "\nTop 10 Companies (with 3+ products):",
+                f"{'Company':<30} {'Products':<10} {'Avg Rating':<12} {'Total Reviews':<15}",
+                "-" * 67,
+            ]
+            lines.extend(
+                f"{row['company_name_short']:<30} "
+                f"{row['product_count']:<10} "
+                f"{row['avg_rating'] or 0.0:<12.2f} "
+                f"{row['total_reviews']:<15}"
+                for row in stats['top_companies']
+            )
+            logger.info("\n".join(lines))
+    
+    def log_results(self):
+        """Log previously gathered results, e.g. after loading them from the cache."""
+        results = self.validation_results
+        logger.info("Validating table record counts...")
+        self._log_table_counts(results.get('table_counts', {}))
+        logger.info("\nValidating data quality...")
+        self._log_quality_checks(results.get('quality_checks', {}))
+        logger.info("\nGenerating statistics...")
+        self._log_statistics(results.get('statistics', {}))
+    
     def generate_report(self) -> str:
         """Generate a comprehensive validation report."""
-        report_lines = []
-        report_lines.append("=" * 80)
-        report_lines.append("ETL PIPELINE VALIDATION REPORT")
-        report_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append("=" * 80)
+        buf = io.StringIO()
+        write = buf.write
+        write("=" * 80 + "\n")
+        write("ETL PIPELINE VALIDATION REPORT\n")
+        write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        write("=" * 80 + "\n")
+        
+        # Each row's status is a severity index into STATUS_LEVELS; the
+        # overall status is the worst one seen, so it is settled as rows are written
+        worst = PASS
         
         # Table counts
         if 'table_counts' in self.validation_results:
             counts = self.validation_results['table_counts']
-            report_lines.append("\nTABLE RECORD COUNTS:")
-            report_lines.append("-" * 80)
+            write("\nTABLE RECORD COUNTS:\n")
+            write("-" * 80 + "\n")
             for table, count in counts.items():
-                status = "PASS" if count > 0 else "FAIL"
-                report_lines.append(f"  {table:<25} {count:>10,} records    [{status}]")
+                severity = FAIL if count == 0 else PASS
+                worst = max(worst, severity)
+                write(f"  {table:<25} {count:>10,} records    [{STATUS_LEVELS[severity]}]\n")
         
         # Data quality
         if 'quality_checks' in self.validation_results:
             checks = self.validation_results['quality_checks']
-            report_lines.append("\nDATA QUALITY CHECKS:")
-            report_lines.append("-" * 80)
-            
-            if 'products_without_price' in checks:
-                count = checks['products_without_price']
-                status = "WARNING" if count > 0 else "PASS"
-                report_lines.append(f"  Products without price:   {count:>10,}            [{status}]")
-            
-            if 'products_without_rating' in checks:
-                count = checks['products_without_rating']
-                status = "WARNING" if count > 0 else "PASS"
-                report_lines.append(f"  Products without rating:  {count:>10,}            [{status}]")
+            write("\nDATA QUALITY CHECKS:\n")
+            write("-" * 80 + "\n")
             
-            if 'duplicate_products' in checks:
-                count = checks['duplicate_products']
-                status = "FAIL" if count > 0 else "PASS"
-                report_lines.append(f"  Duplicate product IDs:    {count:>10,}            [{status}]")
-            
-            if 'orphaned_metrics' in checks:
-                count = checks['orphaned_metrics']
-                status = "FAIL" if count > 0 else "PASS"
-                report_lines.append(f"  Orphaned metrics:         {count:>10,}            [{status}]")
+            for key, label, severity in QUALITY_CHECK_ROWS:
+                if key in checks:
+                    count = checks[key]
+                    if count == 0:
+                        severity = PASS
+                    worst = max(worst, severity)
+                    write(f"  {label:<26}{count:>10,}            [{STATUS_LEVELS[severity]}]\n")
         
         # Overall status
-        report_lines.append("\n" + "=" * 80)
+        write("\n" + "=" * 80 + "\n")
+        overall_status = STATUS_LEVELS[worst]
         
-        # Determine overall status
-        overall_status = "PASS"
-        if 'quality_checks' in self.validation_results:
-            checks = self.validation_results['quality_checks']
-            if checks.get('duplicate_products', 0) > 0 or checks.get('orphaned_metrics', 0) > 0:
-                overall_status = "FAIL"
-            elif checks.get('products_without_price', 0) > 0 or checks.get('products_without_rating', 0) > 0:
-                overall_status = "WARNING"
+        write(f"OVERALL STATUS: {overall_status}\n")
+        write("=" * 80)
         
-        if 'table_counts' in self.validation_results:
-            counts = self.validation_results['table_counts']
-            if any(count == 0 for count in counts.values()):
-                overall_status = "FAIL"
+        return buf.getvalue()
+    
+    def save_parquet(self, timestamp: str):
+        """
+        Save validation results as Parquet files for downstream analysis.
+        
+        Table counts and quality checks form a one-row summary file; each
+        statistics section is written to its own file. Skipped when pandas
+        or a Parquet engine (pyarrow) is not installed; any write or
+        conversion error is logged as a warning rather than raised.
+        
+        Args:
+            timestamp: Run timestamp shared with the text report's filename
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            logger.info("pandas not installed, skipping Parquet export")
+            return
         
-        report_lines.append(f"OVERALL STATUS: {overall_status}")
-        report_lines.append("=" * 80)
+        summary = {'generated_at': datetime.strptime(timestamp, '%Y%m%d_%H%M%S')}
+        summary.update(
+            (f"{table}_count", count)
+            for table, count in self.validation_results.get('table_counts', {}).items()
+        )
+        summary.update(self.validation_results.get('quality_checks', {}))
         
-        return "\n".join(report_lines)
+        frames = {'summary': pd.DataFrame([summary])}
+        for section, rows in self.validation_results.get('statistics', {}).items():
+            if rows:
+                frames[section] = pd.DataFrame(rows)
+        
+        try:
+            for name, df in frames.items():
+                filename = f"validation_{timestamp}_{name}.parquet"
+                df.to_parquet(filename, compression='zstd', index=False)
+        except ImportError:
+            logger.info("No Parquet engine (pyarrow) installed, skipping Parquet export")
+            return
+        except Exception as e:
+            # The export is optional; it must never fail a completed validation
+            logger.warning(f"Parquet export failed: {e}")
+            return
+        logger.info(f"Validation results saved as Parquet: validation_{timestamp}_*.parquet")
     
-    def run_validation(self):
-        """Run all validation checks."""
-        if not self.connect():
-            logger.error("Could not connect to database. Validation aborted.")
+    def _cache_path(self) -> Optional[str]:
+        """
+        Build the cache file path for the current state of the data.
+        
+        The fingerprint comes from table metadata, so it costs no table scan:
+        AUTO_INCREMENT moves on every insert and upsert (InnoDB allocates a
+        value even when ON DUPLICATE KEY UPDATE hits an existing row), and
+        UPDATE_TIME on any modification. UPDATE_TIME is not persisted across
+        server restarts, so the TTL also bounds how long an update made just
+        before a restart can go unnoticed. The connection target is part of
+        the key so different databases never share an entry.
+        """
+        try:
+            try:
+                # MySQL 8 caches these columns for up to a day by default
+                self.cursor.execute("SET SESSION information_schema_stats_expiry = 0")
+            except Error:
+                pass  # Older servers have no such cache
+            self.cursor.execute("""
+                SELECT TABLE_NAME, AUTO_INCREMENT, UPDATE_TIME
+                FROM information_schema.TABLES
+                WHERE TABLE_SCHEMA = DATABASE()
+                  AND TABLE_NAME IN ('categories', 'companies', 'products', 'product_metrics')
+                ORDER BY TABLE_NAME
+            """)
+            fingerprint = [tuple(row.values()) for row in self.cursor.fetchall()]
+        except Error as e:
+            logger.warning(f"Could not fingerprint tables, validation cache disabled: {e}")
+            return None
+        target = [self.db_config.get(k) for k in ('host', 'port', 'database')]
+        digest = hashlib.blake2b(repr((target, fingerprint)).encode('utf-8'), digest_size=16)
+        return os.path.join(self.cache_dir, f"{digest.hexdigest()}.json")
+    
+    def _load_cached_results(self, path: str) -> bool:
+        """Load cached validation results if a fresh entry exists."""
+        try:
+            if time.time() - os.path.getmtime(path) > CACHE_TTL_SECONDS:
+                return False
+            with open(path, 'r', encoding='utf-8') as f:
+                # Decimal keeps prices and ratings as the connector returns them
+                self.validation_results = json.load(f, parse_float=Decimal)
+        except (OSError, ValueError):
             return False
+        logger.info(f"Loaded validation results from cache: {path}")
+        return True
+    
+    def _save_cached_results(self, path: str):
+        """Save validation results for later runs against the same data."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.validation_results, f, default=_json_default)
+        except OSError as e:
+            logger.warning(f"Could not write validation cache: {e}")
+    
+    def _run_step(self, step: str):
+        """
+        Run one validation step on its own database connection.
         
+        The worker shares this instance's validation_results dict; each step
+        writes a distinct key, so the results land in one place. The
+        connection is closed as soon as the step finishes.
+        """
+        worker = ETLValidator(self.db_config)
+        worker.validation_results = self.validation_results
+        worker.connection = mysql.connector.connect(**self.db_config)
+        try:
+            worker.cursor = worker.connection.cursor(dictionary=True)
+            return getattr(worker, step)()
+        finally:
+            if worker.cursor:
+                worker.cursor.close()
+            worker.connection.close()
+    
+    def run_validation(self):
+        """Run all validation checks."""
         try:
-            # Run all validations
-            self.validate_table_counts()
-            self.validate_data_quality()
-            self.generate_statistics()
+            cache_path = None
+            if self.cache_dir:
+                # The main connection is only needed to fingerprint the data
+                if not self.connect():
+                    logger.error("Could not connect to database. Validation aborted.")
+                    return False
+                cache_path = self._cache_path()
+                self.disconnect()
+            
+            if cache_path and self._load_cached_results(cache_path):
+                self.log_results()
+            else:
+                # Run all validations concurrently, each on its own connection;
+                # the steps handle query errors themselves, so an Error here
+                # means a worker could not connect
+                try:
+                    with ThreadPoolExecutor(max_workers=len(VALIDATION_STEPS)) as executor:
+                        futures = [executor.submit(self._run_step, step) for step in VALIDATION_STEPS]
+                        for future in futures:
+                            future.result()
+                except Error as e:
+                    logger.error(f"Database connection failed: {e}")
+                    logger.error("Could not connect to database. Validation aborted.")
+                    return False
+                
+                # Only complete results are cached; a failed check should re-run
+                if cache_path and not self.validation_results.get('failed_checks'):
+                    self._save_cached_results(cache_path)
             
             # Generate and display report
             report = self.generate_report()
             print("\n" + report)
             
-            # Save report to file
-            report_filename = f"validation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+            # Save report to file, with a Parquet copy of the results when available
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            report_filename = f"validation_report_{timestamp}.txt"
             with open(report_filename, 'w') as f:
                 f.write(report)
             logger.info(f"\nValidation report saved to: {report_filename}")
+            self.save_parquet(timestamp)
             
             return True
             
@@ -364,6 +540,13 @@ def main():
     """Main entry point."""
     import getpass
     
+    parser = argparse.ArgumentParser(description="Validate the data loaded by the ETL pipeline.")
+    parser.add_argument(
+        '--cache', nargs='?', const=DEFAULT_CACHE_DIR, default=None, metavar='DIR',
+        help=f"reuse results from an earlier run on unchanged data (default DIR: {DEFAULT_CACHE_DIR})"
+    )
+    args = parser.parse_args()
+    
     print("=" * 80)
     print("ETL Pipeline Validation")
     print("=" * 80)
@@ -385,7 +568,7 @@ def main():
     print()
     
     # Run validation
-    validator = ETLValidator(db_config)
+    validator = ETLValidator(db_config, cache_dir=args.cache)
     success = validator.run_validation()
     
     sys.exit(0 if success else 1)